@@ -71,7 +71,11 @@ class MenpoWidget(Box):
             - ``type`` : ``'change'``
 
             If ``None``, then nothing is added.
+
+        Note that the widget has a single render function. Thus, any existing
+        `self._render_function()` gets removed first.
         """
+        self.remove_render_function()
         self._render_function = render_function
         if self._render_function is not None:
             self.observe(self._render_function, names="selected_values", type="change")
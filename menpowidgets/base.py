@@ -1,8 +1,7 @@
 from collections import OrderedDict
 from collections.abc import Sized
+from copy import deepcopy
 
-import matplotlib.pyplot as plt
-from matplotlib import collections as mc
 import numpy as np
 
 import ipywidgets
@@ -12,7 +11,7 @@ from menpo.base import name_of_callable
 from menpo.image import MaskedImage, Image
 from menpo.image.base import _convert_patches_list_to_single_array
 from menpo.shape import TriMesh, ColouredTriMesh, TexturedTriMesh
-from menpo.visualize import print_dynamic
+from menpo.visualize import print_dynamic, plot_curve
 from menpo.landmark import LandmarkManager
 
 from .options import (
@@ -33,10 +32,16 @@ from .options import (
 )
 from .tools import LogoWidget, SwitchWidget
 from .utils import (
+    debounce,
     extract_group_labels_from_landmarks,
     extract_groups_labels_from_image,
+    mayavi_figure_is_visible,
+    pca_instance_vector,
     render_image,
     render_patches,
+    render_pca_variance_to_png,
+    scaled_pca_basis,
+    update_mayavi_mesh,
 )
 from .checks import check_n_parameters
 from .style import map_styles_to_hex_colours
@@ -1563,8 +1568,6 @@ def plot_graph(x_axis, y_axis, legend_entries=None, figure_size=(9, 5)):
     figure_size : (`int`, `int`), optional
         The initial size of the rendered figure.
     """
-    from menpo.visualize import plot_curve
-
     # Get number of curves to be plotted
     n_curves = len(y_axis)
 
@@ -1607,15 +1610,9 @@ def plot_graph(x_axis, y_axis, legend_entries=None, figure_size=(9, 5)):
     # Group widgets
     logo = LogoWidget(style=main_style)
     logo.layout.margin = "0px 10px 0px 0px"
-    tmp_children = list(plot_wid.tab_box.children)
-    tmp_children.append(save_figure_wid)
-    plot_wid.tab_box.children = tmp_children
-    plot_wid.tab_box.set_title(0, "Labels")
-    plot_wid.tab_box.set_title(1, "Style")
-    plot_wid.tab_box.set_title(2, "Legend")
-    plot_wid.tab_box.set_title(3, "Axes")
-    plot_wid.tab_box.set_title(4, "Zoom")
-    plot_wid.tab_box.set_title(5, "Grid")
+    # Append the export tab. The titles of the rest of the tabs are already
+    # set by the PlotMatplotlibOptionsWidget.
+    plot_wid.tab_box.children = (*plot_wid.tab_box.children, save_figure_wid)
     plot_wid.tab_box.set_title(6, "Export")
 
     # Display final widget
@@ -1711,6 +1708,8 @@ def visualize_shape_model_2d(
     figure_size : (`int`, `int`), optional
         The size of the plotted figures.
     """
+    import matplotlib.pyplot as plt
+    from matplotlib import collections as mc
     from menpo.visualize.viewmatplotlib import _set_axes_options, _parse_axes_limits
 
     # Make sure that shape_model is a list even with one member
@@ -2099,20 +2098,38 @@ def visualize_shape_model_3d(
     # of len n_scales)
     n_parameters = check_n_parameters(n_parameters, n_levels, max_n_params)
 
+    # The eigenvalues are fixed, so compute their square roots once per level
+    # rather than on every render
+    sqrt_eigenvalues = [np.sqrt(sp.eigenvalues) for sp in shape_model]
+
+    # Keep the state of the last render, in order to skip the renders that get
+    # triggered without any actual change
+    rendered_state = [None]
+
     output = ipywidgets.Output()
 
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
-        save_figure_wid.renderer.clear_figure()
-
         # Get selected level
         level = 0
         if n_levels > 1:
             level = level_wid.value
 
-        # Compute weights
+        # Skip rendering if nothing changed since the last render
         parameters = model_parameters_wid.selected_values
-        weights = parameters * shape_model[level].eigenvalues[: len(parameters)] ** 0.5
+        shape_options = shape_options_wid.selected_values
+        renderer_options = None if is_trimesh else renderer_options_wid.selected_values
+        state = (level, parameters, shape_options, renderer_options)
+        if state == rendered_state[0]:
+            return
+
+        # The figure is still empty before the first render
+        renderer = save_figure_wid.renderer
+        if rendered_state[0] is not None:
+            renderer.clear_figure()
+
+        # Compute weights
+        weights = parameters * sqrt_eigenvalues[level][: len(parameters)]
 
         # Compute instance
         instance = shape_model[level].instance(weights)
@@ -2120,18 +2137,16 @@ def visualize_shape_model_3d(
         # Create options dictionary
         options = dict()
         if is_trimesh:
-            options.update(shape_options_wid.selected_values)
+            options.update(shape_options)
         else:
-            options.update(shape_options_wid.selected_values["lines"])
-            options.update(shape_options_wid.selected_values["markers"])
-            options.update(renderer_options_wid.selected_values["numbering_mayavi"])
+            options.update(shape_options["lines"])
+            options.update(shape_options["markers"])
+            options.update(renderer_options["numbering_mayavi"])
             # Correct options based on the type of the shape
             if hasattr(instance, "labels"):
                 # If the shape is a LabelledPointUndirectedGraph ...
                 # ...use with_labels
-                options["with_labels"] = shape_options_wid.selected_values[
-                    "with_labels"
-                ]
+                options["with_labels"] = shape_options["with_labels"]
                 # ...correct colours
                 line_colour = []
                 marker_colour = []
@@ -2151,43 +2166,62 @@ def visualize_shape_model_3d(
         update_info(level, instance.range())
 
         # Render instance
-        save_figure_wid.renderer = instance.view(
-            figure_id=save_figure_wid.renderer.figure_id, new_figure=False, **options
+        renderer = instance.view(
+            figure_id=renderer.figure_id, new_figure=False, **options
         )
 
-        # Force rendering
-        save_figure_wid.renderer.force_draw()
+        # Force rendering, unless the figure's window is hidden
+        if mayavi_figure_is_visible(renderer):
+            renderer.force_draw()
+        save_figure_wid.renderer = renderer
+        rendered_state[0] = deepcopy(state)
+
+    # The models' statistics are fixed, so prepare their info text once per
+    # level and only format the instance's range on every render
+    info_text_per_level = [
+        (
+            [
+                "> Level {} out of {}".format(l + 1, n_levels),
+                "> {} components in total".format(sp.n_components),
+                "> {} active components".format(sp.n_active_components),
+                "> {:.1f}% variance kept".format(sp.variance_ratio() * 100),
+            ],
+            "> {} points".format(sp.mean().n_points),
+        )
+        for l, sp in enumerate(shape_model)
+    ]
 
     # Define function that updates the info text
     def update_info(level, instance_range):
-        text_per_line = [
-            "> Level {} out of {}".format(level + 1, n_levels),
-            "> {} components in total".format(shape_model[level].n_components),
-            "> {} active components".format(shape_model[level].n_active_components),
-            "> {:.1f}% variance kept".format(shape_model[level].variance_ratio() * 100),
+        model_text, points_text = info_text_per_level[level]
+        text_per_line = model_text + [
             "> Instance range: {:.1f} x {:.1f}".format(
                 instance_range[0], instance_range[1]
             ),
-            "> {} points".format(shape_model[level].mean().n_points),
+            points_text,
         ]
         info_wid.set_widget_state(text_per_line=text_per_line)
 
+    # The variance plots never change, so keep them as PNG per level
+    variance_pngs = {}
+
     @output.capture(clear_output=True, wait=True)
     def plot_variance(name):
         # Get selected level
         level = level_wid.value if n_levels > 1 else 0
 
         # Render
-        plt.subplot(121)
-        shape_model[level].plot_eigenvalues_ratio()
-        plt.subplot(122)
-        shape_model[level].plot_eigenvalues_cumulative_ratio()
-        plt.show()
+        if level not in variance_pngs:
+            variance_pngs[level] = render_pca_variance_to_png(shape_model[level])
+        ipydisplay.display(ipydisplay.Image(data=variance_pngs[level]))
+
+    # Coalesce the render calls that are triggered while dragging a slider
+    debounced_render_function = debounce(render_function)
 
     # Create widgets
     model_parameters_wid = LinearModelParametersWidget(
         n_parameters[0],
-        render_function,
+        debounced_render_function,
         params_str="Parameter ",
         mode=mode,
         params_bounds=parameters_bounds,
@@ -2201,19 +2235,19 @@ def visualize_shape_model_3d(
     )
     if is_trimesh:
         shape_options_wid = Mesh3DOptionsWidget(
-            textured=False, render_function=render_function
+            textured=False, render_function=debounced_render_function
         )
     else:
         labels = None
         if hasattr(shape_model[0].mean(), "labels"):
             labels = shape_model[0].mean().labels
         shape_options_wid = Shape3DOptionsWidget(
-            labels=labels, render_function=render_function
+            labels=labels, render_function=debounced_render_function
         )
         renderer_options_wid = RendererOptionsWidget(
             options_tabs=["numbering_mayavi"],
             labels=None,
-            render_function=render_function,
+            render_function=debounced_render_function,
         )
     info_wid = TextPrintWidget(text_per_line=[""])
     save_figure_wid = SaveMayaviFigureOptionsWidget()
@@ -2229,7 +2263,7 @@ def visualize_shape_model_3d(
             )
 
         # Create pyramid radiobuttons
-        radio_str = OrderedDict()
+        radio_str = {}
         for l in range(n_levels):
             if l == 0:
                 radio_str["Level {} (low)".format(l)] = l
@@ -2244,7 +2278,7 @@ def visualize_shape_model_3d(
             layout=ipywidgets.Layout(width="6cm"),
         )
         level_wid.observe(update_widgets, names="value", type="change")
-        level_wid.observe(render_function, names="value", type="change")
+        level_wid.observe(debounced_render_function, names="value", type="change")
         tmp_wid = ipywidgets.HBox([level_wid, model_parameters_wid])
     else:
         tmp_wid = ipywidgets.HBox(children=[model_parameters_wid])
@@ -2422,6 +2456,8 @@ def visualize_appearance_model(
 
     @output.capture(clear_output=True, wait=True)
     def plot_variance(name):
+        import matplotlib.pyplot as plt
+
         # Get selected level
         level = level_wid.value if n_levels > 1 else 0
 
@@ -2690,6 +2726,8 @@ def visualize_patch_appearance_model(
 
     @output.capture(clear_output=True, wait=True)
     def plot_variance(name):
+        import matplotlib.pyplot as plt
+
         # Get selected level
         level = 0
         if n_levels > 1:
@@ -2876,105 +2914,147 @@ def visualize_morphable_model(
         n_texture_parameters, 1, [mm.texture_model.n_active_components]
     )
 
+    # The eigenvalues are fixed, so fold their square roots into the
+    # components once. Then, each render only requires a matrix-vector product
+    # per model with the sliders' values. Single precision is enough for
+    # visualization.
+    shape_basis = scaled_pca_basis(mm.shape_model, dtype=np.float32)
+    texture_basis = scaled_pca_basis(mm.texture_model, dtype=np.float32)
+    # Buffers that store the reconstructed vectors of every render, along with
+    # their views as per-vertex points and colours
+    shape_vector = np.empty_like(shape_basis.mean_vector)
+    texture_vector = np.empty_like(texture_basis.mean_vector)
+    points = shape_vector.reshape([-1, 3])
+    colours = texture_vector.reshape([-1, mm.n_channels])
+    trilist = mm.shape_model.template_instance.trilist
+
+    # Keep the mesh options of the last full render, so that the rendered mesh
+    # can be updated in place if only the model's parameters change
+    rendered_mesh_options = [None]
+
+    # Keep the state of the last render, in order to skip the renders that get
+    # triggered without any actual change
+    rendered_state = [None]
+
     output = ipywidgets.Output()
 
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
-        save_figure_wid.renderer.clear_figure()
-
-        # Compute weights
+        # Skip rendering if nothing changed since the last render
         shape_weights = shape_model_parameters_wid.selected_values
-        shape_weights = (
-            shape_weights * mm.shape_model.eigenvalues[: len(shape_weights)] ** 0.5
-        )
         texture_weights = texture_model_parameters_wid.selected_values
-        texture_weights = (
-            texture_weights
-            * mm.texture_model.eigenvalues[: len(texture_weights)] ** 0.5
+        mesh_options = mesh_options_wid.selected_values
+        state = (shape_weights, texture_weights, mesh_options)
+        if state == rendered_state[0]:
+            return
+
+        # Compute instance
+        pca_instance_vector(
+            shape_weights,
+            shape_basis.components,
+            shape_basis.mean_vector,
+            out=shape_vector,
         )
-        instance = mm.instance(
-            shape_weights=shape_weights, texture_weights=texture_weights
+        pca_instance_vector(
+            texture_weights,
+            texture_basis.components,
+            texture_basis.mean_vector,
+            out=texture_vector,
         )
-        # TODO: Is this really needed?
-        instance = instance.clip_texture()
+        # Clip the texture in place instead of copying the mesh to clip it
+        np.clip(texture_vector, 0.0, 1.0, out=texture_vector)
 
         # Update info
-        update_info(mm, instance)
-
-        # Render instance
-        save_figure_wid.renderer = instance.view(
-            figure_id=save_figure_wid.renderer.figure_id,
-            new_figure=False,
-            **mesh_options_wid.selected_values
-        )
-
-        # Force rendering
-        save_figure_wid.renderer.force_draw()
+        update_info(texture_vector)
+
+        # Render instance. The mesh gets rebuilt only if the mesh options
+        # changed, otherwise its vertices and colours are updated in place
+        # directly from the buffers.
+        renderer = save_figure_wid.renderer
+        if mesh_options != rendered_mesh_options[0] or not update_mayavi_mesh(
+            renderer, points, colours
+        ):
+            # The figure is still empty before the first render
+            if rendered_mesh_options[0] is not None:
+                renderer.clear_figure()
+            instance = ColouredTriMesh(points, trilist=trilist, colours=colours)
+            renderer = instance.view(
+                figure_id=renderer.figure_id, new_figure=False, **mesh_options
+            )
+            save_figure_wid.renderer = renderer
+            rendered_mesh_options[0] = mesh_options.copy()
+
+        # Force rendering, unless the figure's window is hidden
+        if mayavi_figure_is_visible(renderer):
+            renderer.force_draw()
+        rendered_state[0] = deepcopy(state)
+
+    # The model's statistics are fixed, so prepare their info text once and
+    # only format the instance's colour range on every render
+    info_model_text = [
+        "> {} vertices, {} triangles".format(mm.n_vertices, mm.n_triangles),
+        "> {} shape components ({:.2f}% of variance)".format(
+            mm.shape_model.n_components, mm.shape_model.variance_ratio() * 100
+        ),
+        "> {} texture channels".format(mm.n_channels),
+        "> {} texture components ({:.2f}% of variance)".format(
+            mm.texture_model.n_components, mm.texture_model.variance_ratio() * 100
+        ),
+    ]
 
     # Define function that updates the info text
-    def update_info(mm, instance):
-        text_per_line = [
-            "> {} vertices, {} triangles".format(mm.n_vertices, mm.n_triangles),
-            "> {} shape components ({:.2f}% of variance)".format(
-                mm.shape_model.n_components, mm.shape_model.variance_ratio() * 100
-            ),
-            "> {} texture channels".format(mm.n_channels),
-            "> {} texture components ({:.2f}% of variance)".format(
-                mm.texture_model.n_components, mm.texture_model.variance_ratio() * 100
-            ),
-            "> Instance: min={:.3f} , max={:.3f}".format(
-                instance.colours.min(), instance.colours.max()
-            ),
+    def update_info(colours):
+        text_per_line = info_model_text + [
+            "> Instance: min={:.3f} , max={:.3f}".format(colours.min(), colours.max())
         ]
         info_wid.set_widget_state(text_per_line=text_per_line)
 
-    @output.capture(clear_output=True, wait=True)
-    def plot_shape_variance(name):
-        # Render
-        plt.subplot(121)
-        mm.shape_model.plot_eigenvalues_ratio()
-        plt.subplot(122)
-        mm.shape_model.plot_eigenvalues_cumulative_ratio()
-        plt.show()
+    # Define function that creates the variance plotting function of a model.
+    # The plot never changes, so it is kept as PNG after the first time.
+    def create_plot_variance_function(pca_model):
+        variance_png = []
 
-    @output.capture(clear_output=True, wait=True)
-    def plot_texture_variance(name):
-        # Render
-        plt.subplot(121)
-        mm.texture_model.plot_eigenvalues_ratio()
-        plt.subplot(122)
-        mm.texture_model.plot_eigenvalues_cumulative_ratio()
-        plt.show()
+        @output.capture(clear_output=True, wait=True)
+        def plot_variance(name):
+            # Render
+            if not variance_png:
+                variance_png.append(render_pca_variance_to_png(pca_model))
+            ipydisplay.display(ipydisplay.Image(data=variance_png[0]))
+
+        return plot_variance
+
+    # Coalesce the render calls that are triggered while dragging a slider
+    debounced_render_function = debounce(render_function)
 
     # Create widgets
     shape_model_parameters_wid = LinearModelParametersWidget(
         n_shape_parameters[0],
-        render_function,
+        debounced_render_function,
         params_str="Parameter ",
         mode=mode,
         params_bounds=parameters_bounds,
         params_step=0.1,
         plot_variance_visible=True,
-        plot_variance_function=plot_shape_variance,
+        plot_variance_function=create_plot_variance_function(mm.shape_model),
         animation_step=0.5,
         interval=0.0,
         loop_enabled=True,
     )
     texture_model_parameters_wid = LinearModelParametersWidget(
         n_texture_parameters[0],
-        render_function,
+        debounced_render_function,
         params_str="Parameter ",
         mode=mode,
         params_bounds=parameters_bounds,
         params_step=0.1,
         plot_variance_visible=True,
-        plot_variance_function=plot_texture_variance,
+        plot_variance_function=create_plot_variance_function(mm.texture_model),
         animation_step=0.5,
         interval=0.0,
         loop_enabled=True,
     )
     mesh_options_wid = Mesh3DOptionsWidget(
-        textured=True, render_function=render_function
+        textured=True, render_function=debounced_render_function
     )
     info_wid = TextPrintWidget(text_per_line=[""])
     save_figure_wid = SaveMayaviFigureOptionsWidget()
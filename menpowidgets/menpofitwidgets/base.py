@@ -7,22 +7,22 @@ except ImportError as e:
 
 # Continue with imports if we have menpofit
 from collections import OrderedDict
-from typing import Sized
+from collections.abc import Sized
 import numpy as np
 
 import ipywidgets
 import IPython.display as ipydisplay
 
-import matplotlib.pyplot as plt
-
 from menpo.base import name_of_callable
 from menpo.image import MaskedImage
 from menpo.image.base import _convert_patches_list_to_single_array
+from menpo.visualize.viewmatplotlib import MatplotlibImageViewer2d
 
 from menpofit.error import (
     euclidean_bb_normalised_error,
     root_mean_square_bb_normalised_error,
 )
+from menpofit.visualize import plot_cumulative_error_distribution
 
 from ..checks import check_n_parameters
 from ..options import (
@@ -39,10 +39,229 @@ from ..options import (
 )
 from ..tools import LogoWidget
 from ..style import map_styles_to_hex_colours
-from ..utils import render_patches, render_image, extract_groups_labels_from_image
+from ..utils import (
+    debounce,
+    render_patches,
+    render_image,
+    extract_groups_labels_from_image,
+    lazy_tab,
+    pca_instance_vector,
+    scaled_pca_bases,
+)
 
 from ..options import IterativeResultOptionsWidget
 
+# Styling and tab layout shared by every invocation of the AAM and ATM widgets
+_MODEL_STYLE = "info"
+_MODEL_TAB_TITLES = ("Model", "Image", "Landmarks", "Renderer", "Info", "Export")
+_PATCH_AAM_TAB_TITLES = (
+    "Model",
+    "Patches",
+    "Channels",
+    "Shape",
+    "Renderer",
+    "Info",
+    "Export",
+)
+_PATCH_ATM_TAB_TITLES = (
+    "Model",
+    "Patches",
+    "Image",
+    "Shape",
+    "Renderer",
+    "Info",
+    "Export",
+)
+
+# The number of instances that the ATM widgets keep per invocation
+_INSTANCE_CACHE_SIZE = 8
+
+# The vertical axis ticks of the cumulative error distribution plot
+_CED_Y_TICKS = [round(0.1 * i, 1) for i in range(11)]
+
+# The error functions that can be selected in the fitting results widget
+_ERROR_FUNCTIONS = {
+    "Euclidean": euclidean_bb_normalised_error,
+    "RMS": root_mean_square_bb_normalised_error,
+}
+
+
+class _DeferredSaveFigure(object):
+    # Holds the renderer of a widget's figure until its export tab, i.e. the
+    # SaveMatplotlibFigureOptionsWidget, gets built
+    def __init__(self):
+        self.renderer = MatplotlibImageViewer2d(
+            figure_id=None, new_figure=True, image=np.zeros((10, 10))
+        )
+
+
+def _plot_pca_variance(pca_model, zoom, save_figure_wid):
+    # Plots the eigenvalues ratio and cumulative ratio of a PCA model side by
+    # side on the figure of the export tab, so that the plot can be saved
+    import matplotlib.pyplot as plt
+
+    new_figure_size = (zoom * 10, zoom * 3)
+    plt.subplot(121)
+    save_figure_wid.renderer = pca_model.plot_eigenvalues_ratio(
+        figure_id=save_figure_wid.renderer.figure_id, new_figure=False
+    )
+    plt.subplot(122)
+    save_figure_wid.renderer = pca_model.plot_eigenvalues_cumulative_ratio(
+        figure_id=save_figure_wid.renderer.figure_id,
+        new_figure=False,
+        figure_size=new_figure_size,
+    )
+    save_figure_wid.renderer.force_draw()
+
+
+def _pixels_range_function():
+    # Returns a function that gives the (min, max) of an image's pixels. The
+    # widgets reuse their cached instances on options' changes, so the pixels
+    # are only scanned when a different image is passed.
+    last = [None, None]
+
+    def pixels_range(image):
+        if last[0] is not image:
+            last[1] = (image.pixels.min(), image.pixels.max())
+            last[0] = image
+        return last[1]
+
+    return pixels_range
+
+
+def _pyramid_levels_options(n_levels):
+    # The options of the pyramid level radio buttons, as {label: level}
+    def level_str(l):
+        if l == 0:
+            return "Level {} (low)".format(l)
+        elif l == n_levels - 1:
+            return "Level {} (high)".format(l)
+        return "Level {}".format(l)
+
+    return {level_str(l): l for l in range(n_levels)}
+
+
+def _build_level_radio(n_levels, initial_level):
+    # The pyramid level radio buttons, or None if there is a single level
+    if n_levels == 1:
+        return None
+    return ipywidgets.RadioButtons(
+        options=_pyramid_levels_options(n_levels),
+        description="Pyramid",
+        value=initial_level,
+        layout=ipywidgets.Layout(width="6cm"),
+    )
+
+
+def _build_model_parameters_widgets(
+    aam,
+    n_shape_parameters,
+    n_appearance_parameters,
+    initial_level,
+    mode,
+    parameters_bounds,
+    render_function,
+    plot_pca_variance,
+    output,
+    level_wid,
+):
+    # The shape and appearance parameters' widgets of the AAM widgets.
+    # plot_pca_variance(pca_model) plots the variance of a level's model.
+    def create_plot_variance_function(pca_models):
+        @output.capture(clear_output=True, wait=True)
+        def plot_variance(name):
+            # Get selected level
+            level = level_wid.value if level_wid is not None else 0
+
+            # Render
+            plot_pca_variance(pca_models[level])
+
+        return plot_variance
+
+    def create_parameters_widget(n_parameters, pca_models):
+        return LinearModelParametersWidget(
+            n_parameters[initial_level],
+            render_function,
+            params_str="Parameter ",
+            mode=mode,
+            params_bounds=parameters_bounds,
+            params_step=0.1,
+            plot_variance_visible=True,
+            plot_variance_function=create_plot_variance_function(pca_models),
+            animation_step=0.5,
+            interval=0.0,
+            loop_enabled=True,
+        )
+
+    return (
+        create_parameters_widget(
+            n_shape_parameters, [sp.model for sp in aam.shape_models]
+        ),
+        create_parameters_widget(n_appearance_parameters, aam.appearance_models),
+    )
+
+
+def _build_model_widget_layout(
+    output,
+    level_wid,
+    parameters_widgets,
+    n_parameters,
+    options_widgets,
+    tab_titles,
+    update_options_widgets,
+    render_function,
+):
+    # Assembles and displays the AAM and ATM widgets. parameters_widgets and
+    # n_parameters are the (shape,) or (shape, appearance) model's ones,
+    # options_widgets are the tabs that follow the model's one and
+    # update_options_widgets(level) sets them up for a newly selected level.
+    if len(parameters_widgets) == 1:
+        model_parameters_wid = parameters_widgets[0]
+    else:
+        model_parameters_wid = ipywidgets.HBox(
+            [ipywidgets.Tab(list(parameters_widgets))]
+        )
+        model_parameters_wid.children[0].set_title(0, "Shape")
+        model_parameters_wid.children[0].set_title(1, "Appearance")
+    tmp_children = [model_parameters_wid]
+    if level_wid is not None:
+        # Define function that updates options' widgets state and renders the
+        # newly selected level. The options are updated silently, so that the
+        # level is rendered exactly once, with all of them in place.
+        def update_widgets(change):
+            value = change["new"]
+            # Update model parameters
+            for wid, n_params in zip(parameters_widgets, n_parameters):
+                wid.set_widget_state(
+                    n_params[value], params_str="Parameter ", allow_callback=False
+                )
+
+            # Update the rest of the options
+            update_options_widgets(value)
+
+            # Render the new level
+            render_function(change)
+
+        level_wid.observe(update_widgets, names="value", type="change")
+        tmp_children.insert(0, level_wid)
+    tmp_wid = ipywidgets.HBox(tmp_children)
+    options_box = lazy_tab([tmp_wid] + list(options_widgets))
+    for k, tl in enumerate(tab_titles):
+        options_box.set_title(k, tl)
+    logo_wid = LogoWidget(style=_MODEL_STYLE)
+    logo_wid.layout.margin = "0px 10px 0px 0px"
+    output.layout.align_self = "center"
+    wid = ipywidgets.HBox([logo_wid, options_box, output])
+
+    # Set widget's style
+    wid.box_style = _MODEL_STYLE
+    wid.layout.border = "2px solid " + map_styles_to_hex_colours(_MODEL_STYLE)
+
+    # Display final widget
+    final_box = ipywidgets.Box([wid])
+    final_box.layout.display = "flex"
+    ipydisplay.display(final_box)
+
 
 def visualize_aam(
     aam,
@@ -86,9 +305,6 @@ def visualize_aam(
     # Get the number of levels
     n_levels = aam.n_scales
 
-    # Define the styling options
-    main_style = "info"
-
     # Get the maximum number of components per level
     max_n_shape = [sp.model.n_active_components for sp in aam.shape_models]
     max_n_appearance = [ap.n_active_components for ap in aam.appearance_models]
@@ -100,49 +316,80 @@ def visualize_aam(
         n_appearance_parameters, n_levels, max_n_appearance
     )
 
+    # Get the options' metadata of each level. The template instance of an
+    # appearance model has the same channels and landmarks as its mean, but
+    # does not need to be reconstructed.
+    levels_metadata = []
+    for ap in aam.appearance_models:
+        template = ap.template_instance
+        levels_metadata.append(
+            (
+                extract_groups_labels_from_image(template),
+                template.n_channels,
+                isinstance(template, MaskedImage),
+            )
+        )
+
+    # The widget starts from the highest pyramid level, so build the options'
+    # widgets directly for it
+    initial_level = n_levels - 1
+
     output = ipywidgets.Output()
 
+    # Keep the last generated instance, since most of the options' changes do
+    # not affect it
+    instance_cache = [None, None]
+
+    def get_instance(level, shape_weights, appearance_weights):
+        key = (level, tuple(shape_weights), tuple(appearance_weights))
+        if instance_cache[0] != key:
+            instance_cache[1] = aam.instance(
+                shape_weights=shape_weights,
+                appearance_weights=appearance_weights,
+                scale_index=level,
+            )
+            instance_cache[0] = key
+        return instance_cache[1]
+
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
         # Get selected level
-        level = level_wid.value if n_levels > 1 else 0
+        level = level_wid.value if level_wid is not None else 0
 
         # Compute weights and instance
         shape_weights = shape_model_parameters_wid.selected_values
         appearance_weights = appearance_model_parameters_wid.selected_values
-        instance = aam.instance(
-            scale_index=level,
-            shape_weights=shape_weights,
-            appearance_weights=appearance_weights,
-        )
-        image_is_masked = isinstance(instance, MaskedImage)
-        g = landmark_options_wid.selected_values["landmarks"]["group"]
+        instance = get_instance(level, shape_weights, appearance_weights)
+        # The instances of a level are masked if its template is, which is what
+        # the channels' options were set up with
+        image_is_masked = levels_metadata[level][2]
+        landmark_options = landmark_options_wid.selected_values
+        renderer_options = renderer_options_wid.selected_values
+        g = landmark_options["landmarks"]["group"]
 
         # Create options dictionary
-        options = dict()
-        options.update(landmark_options_wid.selected_values["lines"])
-        options.update(landmark_options_wid.selected_values["markers"])
-        options.update(renderer_options_wid.selected_values["numbering_matplotlib"])
-        options.update(renderer_options_wid.selected_values["axes"])
-        options.update(renderer_options_wid.selected_values["legend"])
-        options.update(image_options_wid.selected_values)
-        options.update(landmark_options_wid.selected_values["landmarks"])
+        options = {
+            **landmark_options["lines"],
+            **landmark_options["markers"],
+            **renderer_options["numbering_matplotlib"],
+            **renderer_options["axes"],
+            **renderer_options["legend"],
+            **image_options_wid.selected_values,
+            **landmark_options["landmarks"],
+        }
 
         # Correct options based on the type of the shape
         if instance.has_landmarks and hasattr(instance.landmarks[g], "labels"):
             # If the shape is a LabelledPointUndirectedGraph ...
             # ...correct colours
-            line_colour = []
-            marker_face_colour = []
-            marker_edge_colour = []
-            for lbl in options["with_labels"]:
-                id = instance.landmarks[g].labels.index(lbl)
-                line_colour.append(options["line_colour"][id])
-                marker_face_colour.append(options["marker_face_colour"][id])
-                marker_edge_colour.append(options["marker_edge_colour"][id])
-            options["line_colour"] = line_colour
-            options["marker_face_colour"] = marker_face_colour
-            options["marker_edge_colour"] = marker_edge_colour
+            labels = instance.landmarks[g].labels
+            # The colours are already in place if all the labels are selected
+            if options["with_labels"] != labels:
+                labels_indices = {lbl: k for k, lbl in enumerate(labels)}
+                idx = [labels_indices[lbl] for lbl in options["with_labels"]]
+                for key in ("line_colour", "marker_face_colour", "marker_edge_colour"):
+                    colours = options[key]
+                    options[key] = [colours[k] for k in idx]
         else:
             # If shape is PointCloud, TriMesh or PointGraph
             # ...correct colours
@@ -152,8 +399,8 @@ def visualize_aam(
 
         # Get figure size
         new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * figure_size[0],
-            renderer_options_wid.selected_values["zoom_one"] * figure_size[1],
+            renderer_options["zoom_one"] * figure_size[0],
+            renderer_options["zoom_one"] * figure_size[1],
         )
 
         # show image with selected options
@@ -162,235 +409,145 @@ def visualize_aam(
             renderer=save_figure_wid.renderer,
             image_is_masked=image_is_masked,
             figure_size=new_figure_size,
-            **options
+            **options,
         )
 
         # Update info
         update_info(aam, instance, level, g)
 
     # Define function that updates the info text
-    def update_info(aam, instance, level, group):
-        # features info
-        lvl_app_mod = aam.appearance_models[level]
-        lvl_shape_mod = aam.shape_models[level].model
-        aam_mean = lvl_app_mod.mean()
-        n_channels = aam_mean.n_channels
-        tmplt_inst = lvl_app_mod.mean()
-        feat = aam.holistic_features[level]
+    # The model's info only depends on the level and the landmark group, so
+    # it is built once per (level, group) pair
+    model_info_text = {}
+    pixels_range = _pixels_range_function()
 
-        # Feature string
-        tmp_feat = "Feature is {} with {} channel{}".format(
-            name_of_callable(feat), n_channels, "s" * (n_channels > 1)
-        )
+    def update_info(aam, instance, level, group):
+        if (level, group) not in model_info_text:
+            # features info (the template instance has the same shape and mask
+            # as the mean, without having to reconstruct it)
+            lvl_app_mod = aam.appearance_models[level]
+            lvl_shape_mod = aam.shape_models[level].model
+            tmplt_inst = lvl_app_mod.template_instance
+            n_channels = tmplt_inst.n_channels
+            feat = aam.holistic_features[level]
+
+            # Feature string
+            tmp_feat = "Feature is {} with {} channel{}".format(
+                name_of_callable(feat), n_channels, "s" * (n_channels > 1)
+            )
+            model_info_text[level, group] = [
+                "> Warp using {} transform".format(aam.transform.__name__),
+                "> Level {}/{}".format(level + 1, aam.n_scales),
+                "> {} landmark points".format(instance.landmarks[group].n_points),
+                "> {} shape components ({:.2f}% of variance)".format(
+                    lvl_shape_mod.n_components, lvl_shape_mod.variance_ratio() * 100
+                ),
+                "> {}".format(tmp_feat),
+                "> Reference frame of length {} ({} x {}C, {} x {}C)".format(
+                    lvl_app_mod.n_features,
+                    tmplt_inst.n_true_pixels(),
+                    n_channels,
+                    tmplt_inst._str_shape(),
+                    n_channels,
+                ),
+                "> {} appearance components ({:.2f}% of variance)".format(
+                    lvl_app_mod.n_components, lvl_app_mod.variance_ratio() * 100
+                ),
+            ]
 
         # update info widgets
-        text_per_line = [
-            "> Warp using {} transform".format(aam.transform.__name__),
-            "> Level {}/{}".format(level + 1, aam.n_scales),
-            "> {} landmark points".format(instance.landmarks[group].n_points),
-            "> {} shape components ({:.2f}% of variance)".format(
-                lvl_shape_mod.n_components, lvl_shape_mod.variance_ratio() * 100
-            ),
-            "> {}".format(tmp_feat),
-            "> Reference frame of length {} ({} x {}C, {} x {}C)".format(
-                lvl_app_mod.n_features,
-                tmplt_inst.n_true_pixels(),
-                n_channels,
-                tmplt_inst._str_shape(),
-                n_channels,
-            ),
-            "> {} appearance components ({:.2f}% of variance)".format(
-                lvl_app_mod.n_components, lvl_app_mod.variance_ratio() * 100
-            ),
-            "> Instance: min={:.3f} , max={:.3f}".format(
-                instance.pixels.min(), instance.pixels.max()
-            ),
+        text_per_line = model_info_text[level, group] + [
+            "> Instance: min={:.3f} , max={:.3f}".format(*pixels_range(instance))
         ]
         info_wid.set_widget_state(text_per_line=text_per_line)
 
-    @output.capture(clear_output=True, wait=True)
-    def plot_shape_variance(name):
-        # Get selected level
-        level = level_wid.value if n_levels > 1 else 0
-
-        # Render
-        new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * 10,
-            renderer_options_wid.selected_values["zoom_one"] * 3,
-        )
-        plt.subplot(121)
-        save_figure_wid.renderer = aam.shape_models[level].model.plot_eigenvalues_ratio(
-            figure_id=save_figure_wid.renderer.figure_id, new_figure=False
+    def plot_pca_variance(pca_model):
+        _plot_pca_variance(
+            pca_model, renderer_options_wid.selected_values["zoom_one"], save_figure_wid
         )
-        plt.subplot(122)
-        save_figure_wid.renderer = aam.shape_models[
-            level
-        ].model.plot_eigenvalues_cumulative_ratio(
-            figure_id=save_figure_wid.renderer.figure_id,
-            new_figure=False,
-            figure_size=new_figure_size,
-        )
-        save_figure_wid.renderer.force_draw()
 
-    @output.capture(clear_output=True, wait=True)
-    def plot_appearance_variance(name):
-        # Get selected level
-        level = level_wid.value if n_levels > 1 else 0
-
-        # Render
-        new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * 10,
-            renderer_options_wid.selected_values["zoom_one"] * 3,
-        )
-        plt.subplot(121)
-        save_figure_wid.renderer = aam.appearance_models[level].plot_eigenvalues_ratio(
-            figure_id=save_figure_wid.renderer.figure_id, new_figure=False
-        )
-        plt.subplot(122)
-        save_figure_wid.renderer = aam.appearance_models[
-            level
-        ].plot_eigenvalues_cumulative_ratio(
-            figure_id=save_figure_wid.renderer.figure_id,
-            new_figure=False,
-            figure_size=new_figure_size,
-        )
-        save_figure_wid.renderer.force_draw()
+    # Coalesce the render calls that are triggered while dragging a slider
+    debounced_render_function = debounce(render_function)
 
     # Create widgets
-    shape_model_parameters_wid = LinearModelParametersWidget(
-        n_shape_parameters[0],
-        render_function,
-        params_str="Parameter ",
-        mode=mode,
-        params_bounds=parameters_bounds,
-        params_step=0.1,
-        plot_variance_visible=True,
-        plot_variance_function=plot_shape_variance,
-        animation_step=0.5,
-        interval=0.0,
-        loop_enabled=True,
-    )
-    appearance_model_parameters_wid = LinearModelParametersWidget(
-        n_appearance_parameters[0],
-        render_function,
-        params_str="Parameter ",
-        mode=mode,
-        params_bounds=parameters_bounds,
-        params_step=0.1,
-        plot_variance_visible=True,
-        plot_variance_function=plot_appearance_variance,
-        animation_step=0.5,
-        interval=0.0,
-        loop_enabled=True,
-    )
-    groups_keys, labels_keys = extract_groups_labels_from_image(
-        aam.appearance_models[0].mean()
+    level_wid = _build_level_radio(n_levels, initial_level)
+    (
+        shape_model_parameters_wid,
+        appearance_model_parameters_wid,
+    ) = _build_model_parameters_widgets(
+        aam,
+        n_shape_parameters,
+        n_appearance_parameters,
+        initial_level,
+        mode,
+        parameters_bounds,
+        debounced_render_function,
+        plot_pca_variance,
+        output,
+        level_wid,
     )
+    (groups_keys, labels_keys), n_channels, image_is_masked = levels_metadata[
+        initial_level
+    ]
     image_options_wid = ImageOptionsWidget(
-        n_channels=aam.appearance_models[0].mean().n_channels,
-        image_is_masked=isinstance(aam.appearance_models[0].mean(), MaskedImage),
-        render_function=render_function,
+        n_channels=n_channels,
+        image_is_masked=image_is_masked,
+        render_function=debounced_render_function,
     )
     landmark_options_wid = LandmarkOptionsWidget(
         group_keys=groups_keys,
         labels_keys=labels_keys,
         type="2D",
-        render_function=render_function,
+        render_function=debounced_render_function,
     )
     renderer_options_wid = RendererOptionsWidget(
         options_tabs=["zoom_one", "axes", "numbering_matplotlib", "legend"],
         labels=None,
         axes_x_limits=None,
         axes_y_limits=None,
-        render_function=render_function,
+        render_function=debounced_render_function,
     )
     info_wid = TextPrintWidget(text_per_line=[""])
-    save_figure_wid = SaveMatplotlibFigureOptionsWidget()
-
-    # Group widgets
-    model_parameters_wid = ipywidgets.HBox(
-        [ipywidgets.Tab([shape_model_parameters_wid, appearance_model_parameters_wid])]
-    )
-    model_parameters_wid.children[0].set_title(0, "Shape")
-    model_parameters_wid.children[0].set_title(1, "Appearance")
-    tmp_children = [model_parameters_wid]
-    if n_levels > 1:
-        # Define function that updates options' widgets state
-        def update_widgets(change):
-            value = change["new"]
-            # Update shape model parameters
-            shape_model_parameters_wid.set_widget_state(
-                n_shape_parameters[value], params_str="Parameter ", allow_callback=False
-            )
-
-            # Update appearance model parameters
-            appearance_model_parameters_wid.set_widget_state(
-                n_appearance_parameters[value],
-                params_str="Parameter ",
-                allow_callback=False,
-            )
-
-            # Update landmarks options
-            g_keys, l_keys = extract_groups_labels_from_image(
-                aam.appearance_models[value].mean()
-            )
-            landmark_options_wid.set_widget_state(
-                group_keys=g_keys, labels_keys=l_keys, allow_callback=False
-            )
-
-            # Update channel options
-            image_options_wid.set_widget_state(
-                n_channels=aam.appearance_models[value].mean().n_channels,
-                image_is_masked=isinstance(
-                    aam.appearance_models[value].mean(), MaskedImage
-                ),
-                allow_callback=True,
-            )
+    # The export options are only built once their tab gets selected
+    save_figure_wid = _DeferredSaveFigure()
+
+    def build_save_figure_wid():
+        nonlocal save_figure_wid
+        save_figure_wid = SaveMatplotlibFigureOptionsWidget(save_figure_wid.renderer)
+        return save_figure_wid
+
+    # Define function that updates the options' widgets state of a level
+    def update_options_widgets(level):
+        # Update landmarks options
+        (g_keys, l_keys), n_channels, image_is_masked = levels_metadata[level]
+        landmark_options_wid.set_widget_state(
+            group_keys=g_keys, labels_keys=l_keys, allow_callback=False
+        )
 
-        radio_str = OrderedDict()
-        for l in range(n_levels):
-            if l == 0:
-                radio_str["Level {} (low)".format(l)] = l
-            elif l == n_levels - 1:
-                radio_str["Level {} (high)".format(l)] = l
-            else:
-                radio_str["Level {}".format(l)] = l
-        level_wid = ipywidgets.RadioButtons(
-            options=radio_str,
-            description="Pyramid",
-            value=n_levels - 1,
-            layout=ipywidgets.Layout(width="6cm"),
+        # Update channel options
+        image_options_wid.set_widget_state(
+            n_channels=n_channels,
+            image_is_masked=image_is_masked,
+            allow_callback=False,
         )
-        level_wid.observe(update_widgets, names="value", type="change")
-        level_wid.observe(render_function, names="value", type="change")
-        tmp_children.insert(0, level_wid)
-    tmp_wid = ipywidgets.HBox(tmp_children)
-    options_box = ipywidgets.Tab(
+
+    # Group widgets and display them
+    _build_model_widget_layout(
+        output,
+        level_wid,
+        (shape_model_parameters_wid, appearance_model_parameters_wid),
+        (n_shape_parameters, n_appearance_parameters),
         [
-            tmp_wid,
             image_options_wid,
             landmark_options_wid,
             renderer_options_wid,
             info_wid,
-            save_figure_wid,
-        ]
+            build_save_figure_wid,
+        ],
+        _MODEL_TAB_TITLES,
+        update_options_widgets,
+        debounced_render_function,
     )
-    tab_titles = ["Model", "Image", "Landmarks", "Renderer", "Info", "Export"]
-    for k, tl in enumerate(tab_titles):
-        options_box.set_title(k, tl)
-    logo_wid = LogoWidget(style=main_style)
-    logo_wid.layout.margin = "0px 10px 0px 0px"
-    output.layout.align_self = "center"
-    wid = ipywidgets.HBox([logo_wid, options_box, output])
-
-    # Set widget's style
-    wid.box_style = main_style
-    wid.layout.border = "2px solid " + map_styles_to_hex_colours(main_style)
-
-    # Display final widget
-    final_box = ipywidgets.Box([wid])
-    final_box.layout.display = "flex"
-    ipydisplay.display(final_box)
 
     # Trigger initial visualization
     render_function({})
@@ -438,9 +595,6 @@ def visualize_patch_aam(
     # Get the number of levels
     n_levels = aam.n_scales
 
-    # Define the styling options
-    main_style = "info"
-
     # Get the maximum number of components per level
     max_n_shape = [sp.model.n_active_components for sp in aam.shape_models]
     max_n_appearance = [ap.n_active_components for ap in aam.appearance_models]
@@ -452,40 +606,88 @@ def visualize_patch_aam(
         n_appearance_parameters, n_levels, max_n_appearance
     )
 
+    # Get the scaled bases of the models, so that the shape and appearance
+    # instances are reconstructed with a single matrix-vector product each.
+    # Single precision is enough for displaying the appearance and halves the
+    # memory traffic of its reconstruction.
+    shape_bases = scaled_pca_bases([sp.model for sp in aam.shape_models])
+    appearance_bases = scaled_pca_bases(aam.appearance_models, dtype=np.float32)
+    # Preallocate the buffers that the appearance vectors get reconstructed in
+    appearance_vectors = [np.empty_like(b.mean_vector) for b in appearance_bases]
+
+    # Get the (n_patches, n_offsets, n_channels, height, width) shape of each
+    # level's patches from the template instances, which do not need to be
+    # reconstructed
+    pixels_shapes = [ap.template_instance.pixels.shape for ap in aam.appearance_models]
+
+    # The widget starts from the highest pyramid level, so build the options'
+    # widgets directly for it
+    initial_level = n_levels - 1
+
     output = ipywidgets.Output()
 
+    # Keep the last generated instance, since most of the options' changes do
+    # not affect it
+    instance_cache = [None, None]
+
+    def get_instance(level, shape_weights, appearance_weights):
+        key = (level, tuple(shape_weights), tuple(appearance_weights))
+        if instance_cache[0] != key:
+            shape_model = aam.shape_models[level].model
+            shape_basis = shape_bases[level]
+            shape_instance = shape_model.template_instance.from_vector(
+                pca_instance_vector(
+                    shape_weights, shape_basis.components, shape_basis.mean_vector
+                )
+            )
+            appearance_model = aam.appearance_models[level]
+            appearance_basis = appearance_bases[level]
+            appearance_instance = appearance_model.template_instance.from_vector(
+                pca_instance_vector(
+                    appearance_weights,
+                    appearance_basis.components,
+                    appearance_basis.mean_vector,
+                    out=appearance_vectors[level],
+                ),
+                copy=False,
+            )
+            # A patch AAM's instance is just its shape and appearance instances
+            instance_cache[1] = (shape_instance, appearance_instance)
+            instance_cache[0] = key
+        return instance_cache[1]
+
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
         # Get selected level
-        level = level_wid.value if n_levels > 1 else 0
+        level = level_wid.value if level_wid is not None else 0
 
         # Compute weights and instance
         shape_weights = shape_model_parameters_wid.selected_values
         appearance_weights = appearance_model_parameters_wid.selected_values
-        shape_instance, appearance_instance = aam.instance(
-            scale_index=level,
-            shape_weights=shape_weights,
-            appearance_weights=appearance_weights,
+        shape_instance, appearance_instance = get_instance(
+            level, shape_weights, appearance_weights
         )
 
         # Render instance with selected options
-        options = dict()
-        options.update(shape_options_wid.selected_values["lines"])
-        options.update(shape_options_wid.selected_values["markers"])
-        options.update(renderer_options_wid.selected_values["numbering_matplotlib"])
-        options.update(renderer_options_wid.selected_values["axes"])
-        image_options = dict(image_options_wid.selected_values)
-        del image_options["masked_enabled"]
-        options.update(image_options)
-        options.update(patch_options_wid.selected_values)
+        shape_options = shape_options_wid.selected_values
+        renderer_options = renderer_options_wid.selected_values
+        options = {
+            **shape_options["lines"],
+            **shape_options["markers"],
+            **renderer_options["numbering_matplotlib"],
+            **renderer_options["axes"],
+            **image_options_wid.selected_values,
+            **patch_options_wid.selected_values,
+        }
+        del options["masked_enabled"]
         options["line_colour"] = options["line_colour"][0]
         options["marker_face_colour"] = options["marker_face_colour"][0]
         options["marker_edge_colour"] = options["marker_edge_colour"][0]
 
         # Get figure size
         new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * figure_size[0],
-            renderer_options_wid.selected_values["zoom_one"] * figure_size[1],
+            renderer_options["zoom_one"] * figure_size[0],
+            renderer_options["zoom_one"] * figure_size[1],
         )
 
         # show image with selected options
@@ -494,240 +696,155 @@ def visualize_patch_aam(
             patch_centers=shape_instance,
             renderer=save_figure_wid.renderer,
             figure_size=new_figure_size,
-            **options
+            **options,
         )
 
         # Update info
         update_info(aam, appearance_instance, level)
 
     # Define function that updates the info text
-    def update_info(aam, appearance_instance, level):
-        lvl_app_mod = aam.appearance_models[level]
-        lvl_shape_mod = aam.shape_models[level].model
-        n_channels = lvl_app_mod.mean().pixels.shape[2]
-        feat = aam.holistic_features[level]
+    # The model's info only depends on the level, so it is built once per
+    # level
+    model_info_text = {}
+    pixels_range = _pixels_range_function()
 
-        # Feature string
-        tmp_feat = "Feature is {} with {} channel{}".format(
-            name_of_callable(feat), n_channels, "s" * (n_channels > 1)
-        )
-        n_feat = (
-            appearance_instance.pixels.shape[0]
-            * appearance_instance.pixels.shape[2]
-            * appearance_instance.pixels.shape[3]
-            * appearance_instance.pixels.shape[4]
-        )
+    def update_info(aam, appearance_instance, level):
+        if level not in model_info_text:
+            lvl_app_mod = aam.appearance_models[level]
+            lvl_shape_mod = aam.shape_models[level].model
+            pixels_shape = appearance_instance.pixels.shape
+            n_channels = pixels_shape[2]
+            feat = aam.holistic_features[level]
+
+            # Feature string
+            tmp_feat = "Feature is {} with {} channel{}".format(
+                name_of_callable(feat), n_channels, "s" * (n_channels > 1)
+            )
+            n_feat = (
+                pixels_shape[0] * pixels_shape[2] * pixels_shape[3] * pixels_shape[4]
+            )
+            model_info_text[level] = [
+                "> No image warping performed.",
+                "> Level {}/{}".format(level + 1, aam.n_scales),
+                "> {} landmark points".format(pixels_shape[0]),
+                "> {} shape components ({:.2f}% of variance)".format(
+                    lvl_shape_mod.n_components, lvl_shape_mod.variance_ratio() * 100
+                ),
+                "> {}".format(tmp_feat),
+                "> Reference frame of length {} ({} patches of shape {} x {} "
+                "and {} channel{}.)".format(
+                    n_feat,
+                    pixels_shape[0],
+                    pixels_shape[3],
+                    pixels_shape[4],
+                    n_channels,
+                    "s" * (n_channels > 1),
+                ),
+                "> {} appearance components ({:.2f}% of variance)".format(
+                    lvl_app_mod.n_components, lvl_app_mod.variance_ratio() * 100
+                ),
+            ]
 
         # update info widgets
-        text_per_line = [
-            "> No image warping performed.",
-            "> Level {}/{}".format(level + 1, aam.n_scales),
-            "> {} landmark points".format(appearance_instance.pixels.shape[0]),
-            "> {} shape components ({:.2f}% of variance)".format(
-                lvl_shape_mod.n_components, lvl_shape_mod.variance_ratio() * 100
-            ),
-            "> {}".format(tmp_feat),
-            "> Reference frame of length {} ({} patches of shape {} x {} "
-            "and {} channel{}.)".format(
-                n_feat,
-                appearance_instance.pixels.shape[0],
-                appearance_instance.pixels.shape[3],
-                appearance_instance.pixels.shape[4],
-                appearance_instance.pixels.shape[2],
-                "s" * (appearance_instance.pixels.shape[2] > 1),
-            ),
-            "> {} appearance components ({:.2f}% of variance)".format(
-                lvl_app_mod.n_components, lvl_app_mod.variance_ratio() * 100
-            ),
+        text_per_line = model_info_text[level] + [
             "> Instance: min={:.3f} , max={:.3f}".format(
-                appearance_instance.pixels.min(), appearance_instance.pixels.max()
-            ),
+                *pixels_range(appearance_instance)
+            )
         ]
         info_wid.set_widget_state(text_per_line=text_per_line)
 
-    @output.capture(clear_output=True, wait=True)
-    def plot_shape_variance(name):
-        # Get selected level
-        level = level_wid.value if n_levels > 1 else 0
-
-        # Render
-        new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * 10,
-            renderer_options_wid.selected_values["zoom_one"] * 3,
-        )
-        plt.subplot(121)
-        save_figure_wid.renderer = aam.shape_models[level].model.plot_eigenvalues_ratio(
-            figure_id=save_figure_wid.renderer.figure_id, new_figure=False
-        )
-        plt.subplot(122)
-        save_figure_wid.renderer = aam.shape_models[
-            level
-        ].model.plot_eigenvalues_cumulative_ratio(
-            figure_id=save_figure_wid.renderer.figure_id,
-            new_figure=False,
-            figure_size=new_figure_size,
+    def plot_pca_variance(pca_model):
+        _plot_pca_variance(
+            pca_model, renderer_options_wid.selected_values["zoom_one"], save_figure_wid
         )
-        save_figure_wid.renderer.force_draw()
-
-    @output.capture(clear_output=True, wait=True)
-    def plot_appearance_variance(name):
-        # Get selected level
-        level = level_wid.value if n_levels > 1 else 0
 
-        # Render
-        new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * 10,
-            renderer_options_wid.selected_values["zoom_one"] * 3,
-        )
-        plt.subplot(121)
-        save_figure_wid.renderer = aam.appearance_models[level].plot_eigenvalues_ratio(
-            figure_id=save_figure_wid.renderer.figure_id, new_figure=False
-        )
-        plt.subplot(122)
-        save_figure_wid.renderer = aam.appearance_models[
-            level
-        ].plot_eigenvalues_cumulative_ratio(
-            figure_id=save_figure_wid.renderer.figure_id,
-            new_figure=False,
-            figure_size=new_figure_size,
-        )
-        save_figure_wid.renderer.force_draw()
+    # Coalesce the render calls that are triggered while dragging a slider
+    debounced_render_function = debounce(render_function)
 
     # Create widgets
-    shape_model_parameters_wid = LinearModelParametersWidget(
-        n_shape_parameters[0],
-        render_function,
-        params_str="Parameter ",
-        mode=mode,
-        params_bounds=parameters_bounds,
-        params_step=0.1,
-        plot_variance_visible=True,
-        plot_variance_function=plot_shape_variance,
-        animation_step=0.5,
-        interval=0.0,
-        loop_enabled=True,
-    )
-    appearance_model_parameters_wid = LinearModelParametersWidget(
-        n_appearance_parameters[0],
-        render_function,
-        params_str="Parameter ",
-        mode=mode,
-        params_bounds=parameters_bounds,
-        params_step=0.1,
-        plot_variance_visible=True,
-        plot_variance_function=plot_appearance_variance,
-        animation_step=0.5,
-        interval=0.0,
-        loop_enabled=True,
+    level_wid = _build_level_radio(n_levels, initial_level)
+    (
+        shape_model_parameters_wid,
+        appearance_model_parameters_wid,
+    ) = _build_model_parameters_widgets(
+        aam,
+        n_shape_parameters,
+        n_appearance_parameters,
+        initial_level,
+        mode,
+        parameters_bounds,
+        debounced_render_function,
+        plot_pca_variance,
+        output,
+        level_wid,
     )
     shape_options_wid = Shape2DOptionsWidget(labels=None, render_function=None)
     shape_options_wid.line_options_wid.render_lines_switch.button_wid.value = False
-    shape_options_wid.add_render_function(render_function)
+    shape_options_wid.add_render_function(debounced_render_function)
+    initial_pixels_shape = pixels_shapes[initial_level]
     patch_options_wid = PatchOptionsWidget(
-        n_patches=aam.appearance_models[0].mean().pixels.shape[0],
-        n_offsets=aam.appearance_models[0].mean().pixels.shape[1],
-        render_function=render_function,
+        n_patches=initial_pixels_shape[0],
+        n_offsets=initial_pixels_shape[1],
+        render_function=debounced_render_function,
     )
     image_options_wid = ImageOptionsWidget(
-        n_channels=aam.appearance_models[0].mean().pixels.shape[2],
+        n_channels=initial_pixels_shape[2],
         image_is_masked=False,
         render_function=None,
     )
     image_options_wid.interpolation_checkbox.button_wid.value = False
-    image_options_wid.add_render_function(render_function)
+    image_options_wid.add_render_function(debounced_render_function)
     renderer_options_wid = RendererOptionsWidget(
         options_tabs=["zoom_one", "axes", "numbering_matplotlib"],
         labels=None,
         axes_x_limits=None,
         axes_y_limits=None,
-        render_function=render_function,
+        render_function=debounced_render_function,
     )
     info_wid = TextPrintWidget(text_per_line=[""])
-    save_figure_wid = SaveMatplotlibFigureOptionsWidget()
-
-    # Group widgets
-    model_parameters_wid = ipywidgets.HBox(
-        [ipywidgets.Tab([shape_model_parameters_wid, appearance_model_parameters_wid])]
-    )
-    model_parameters_wid.children[0].set_title(0, "Shape")
-    model_parameters_wid.children[0].set_title(1, "Appearance")
-    tmp_children = [model_parameters_wid]
-    if n_levels > 1:
-        # Define function that updates options' widgets state
-        def update_widgets(change):
-            value = change["new"]
-            # Update shape model parameters
-            shape_model_parameters_wid.set_widget_state(
-                n_shape_parameters[value], params_str="Parameter ", allow_callback=False
-            )
-
-            # Update appearance model parameters
-            appearance_model_parameters_wid.set_widget_state(
-                n_appearance_parameters[value],
-                params_str="Parameter ",
-                allow_callback=False,
-            )
-
-            # Update patch options
-            patch_options_wid.set_widget_state(
-                n_patches=aam.appearance_models[value].mean().pixels.shape[0],
-                n_offsets=aam.appearance_models[value].mean().pixels.shape[1],
-                allow_callback=False,
-            )
-
-            # Update channels options
-            image_options_wid.set_widget_state(
-                n_channels=aam.appearance_models[value].mean().pixels.shape[2],
-                image_is_masked=False,
-                allow_callback=True,
-            )
+    # The export options are only built once their tab gets selected
+    save_figure_wid = _DeferredSaveFigure()
+
+    def build_save_figure_wid():
+        nonlocal save_figure_wid
+        save_figure_wid = SaveMatplotlibFigureOptionsWidget(save_figure_wid.renderer)
+        return save_figure_wid
+
+    # Define function that updates the options' widgets state of a level
+    def update_options_widgets(level):
+        # Update patch options
+        pix_shape = pixels_shapes[level]
+        patch_options_wid.set_widget_state(
+            n_patches=pix_shape[0],
+            n_offsets=pix_shape[1],
+            allow_callback=False,
+        )
 
-        # Create pyramid radiobuttons
-        radio_str = OrderedDict()
-        for l in range(n_levels):
-            if l == 0:
-                radio_str["Level {} (low)".format(l)] = l
-            elif l == n_levels - 1:
-                radio_str["Level {} (high)".format(l)] = l
-            else:
-                radio_str["Level {}".format(l)] = l
-        level_wid = ipywidgets.RadioButtons(
-            options=radio_str,
-            description="Pyramid",
-            value=n_levels - 1,
-            layout=ipywidgets.Layout(width="6cm"),
+        # Update channels options
+        image_options_wid.set_widget_state(
+            n_channels=pix_shape[2],
+            image_is_masked=False,
+            allow_callback=False,
         )
-        level_wid.observe(update_widgets, names="value", type="change")
-        level_wid.observe(render_function, names="value", type="change")
-        tmp_children.insert(0, level_wid)
-    tmp_wid = ipywidgets.HBox(tmp_children)
-    options_box = ipywidgets.Tab(
+
+    # Group widgets and display them
+    _build_model_widget_layout(
+        output,
+        level_wid,
+        (shape_model_parameters_wid, appearance_model_parameters_wid),
+        (n_shape_parameters, n_appearance_parameters),
         [
-            tmp_wid,
             patch_options_wid,
             image_options_wid,
             shape_options_wid,
             renderer_options_wid,
             info_wid,
-            save_figure_wid,
-        ]
+            build_save_figure_wid,
+        ],
+        _PATCH_AAM_TAB_TITLES,
+        update_options_widgets,
+        debounced_render_function,
     )
-    tab_titles = ["Model", "Patches", "Channels", "Shape", "Renderer", "Info", "Export"]
-    for k, tl in enumerate(tab_titles):
-        options_box.set_title(k, tl)
-    logo_wid = LogoWidget(style=main_style)
-    logo_wid.layout.margin = "0px 10px 0px 0px"
-    output.layout.align_self = "center"
-    wid = ipywidgets.HBox([logo_wid, options_box, output])
-
-    # Set widget's style
-    wid.box_style = main_style
-    wid.layout.border = "2px solid " + map_styles_to_hex_colours(main_style)
-
-    # Display final widget
-    final_box = ipywidgets.Box([wid])
-    final_box.layout.display = "flex"
-    ipydisplay.display(final_box)
 
     # Trigger initial visualization
     render_function({})
@@ -767,9 +884,6 @@ def visualize_atm(
     # Get the number of levels
     n_levels = atm.n_scales
 
-    # Define the styling options
-    main_style = "info"
-
     # Get the maximum number of components per level
     max_n_shape = [sp.model.n_active_components for sp in atm.shape_models]
 
@@ -777,44 +891,86 @@ def visualize_atm(
     # of len n_scales)
     n_shape_parameters = check_n_parameters(n_shape_parameters, n_levels, max_n_shape)
 
+    # Get the options' metadata of each level
+    levels_metadata = [
+        (
+            extract_groups_labels_from_image(template),
+            template.n_channels,
+            isinstance(template, MaskedImage),
+        )
+        for template in atm.warped_templates
+    ]
+    # Get the properties of each level that are reported in the info text
+    levels_info = [
+        (
+            name_of_callable(feat),
+            sp.model.n_components,
+            sp.model.variance_ratio() * 100,
+            template.n_true_pixels(),
+            template._str_shape(),
+        )
+        for feat, sp, template in zip(
+            atm.holistic_features, atm.shape_models, atm.warped_templates
+        )
+    ]
+
+    # The widget starts from the highest pyramid level, so build the options'
+    # widgets directly for it
+    initial_level = n_levels - 1
+
     output = ipywidgets.Output()
 
+    # Keep the most recently generated instances, since most of the options'
+    # changes do not affect them
+    instance_cache = OrderedDict()
+
+    def get_instance(level, shape_weights):
+        key = (level, tuple(shape_weights))
+        if key in instance_cache:
+            instance_cache.move_to_end(key)
+        else:
+            instance_cache[key] = atm.instance(
+                shape_weights=shape_weights, scale_index=level
+            )
+            if len(instance_cache) > _INSTANCE_CACHE_SIZE:
+                instance_cache.popitem(last=False)
+        return instance_cache[key]
+
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
         # Get selected level
-        level = level_wid.value if n_levels > 1 else 0
+        level = level_wid.value if level_wid is not None else 0
 
         # Compute weights and instance
         shape_weights = shape_model_parameters_wid.selected_values
-        instance = atm.instance(scale_index=level, shape_weights=shape_weights)
+        instance = get_instance(level, shape_weights)
         image_is_masked = isinstance(instance, MaskedImage)
-        g = landmark_options_wid.selected_values["landmarks"]["group"]
+        landmark_options = landmark_options_wid.selected_values
+        renderer_options = renderer_options_wid.selected_values
+        g = landmark_options["landmarks"]["group"]
 
         # Render instance with selected options
-        options = dict()
-        options.update(landmark_options_wid.selected_values["lines"])
-        options.update(landmark_options_wid.selected_values["markers"])
-        options.update(renderer_options_wid.selected_values["numbering_matplotlib"])
-        options.update(renderer_options_wid.selected_values["axes"])
-        options.update(renderer_options_wid.selected_values["legend"])
-        options.update(image_options_wid.selected_values)
-        options.update(landmark_options_wid.selected_values["landmarks"])
+        options = {
+            **landmark_options["lines"],
+            **landmark_options["markers"],
+            **renderer_options["numbering_matplotlib"],
+            **renderer_options["axes"],
+            **renderer_options["legend"],
+            **image_options_wid.selected_values,
+            **landmark_options["landmarks"],
+        }
 
         # Correct options based on the type of the shape
         if instance.has_landmarks and hasattr(instance.landmarks[g], "labels"):
             # If the shape is a LabelledPointUndirectedGraph ...
             # ...correct colours
-            line_colour = []
-            marker_face_colour = []
-            marker_edge_colour = []
-            for lbl in options["with_labels"]:
-                id = instance.landmarks[g].labels.index(lbl)
-                line_colour.append(options["line_colour"][id])
-                marker_face_colour.append(options["marker_face_colour"][id])
-                marker_edge_colour.append(options["marker_edge_colour"][id])
-            options["line_colour"] = line_colour
-            options["marker_face_colour"] = marker_face_colour
-            options["marker_edge_colour"] = marker_edge_colour
+            labels_indices = {
+                lbl: k for k, lbl in enumerate(instance.landmarks[g].labels)
+            }
+            idx = [labels_indices[lbl] for lbl in options["with_labels"]]
+            for key in ("line_colour", "marker_face_colour", "marker_edge_colour"):
+                colours = options[key]
+                options[key] = [colours[k] for k in idx]
         else:
             # If shape is PointCloud, TriMesh or PointGraph
             # ...correct colours
@@ -824,8 +980,8 @@ def visualize_atm(
 
         # Get figure size
         new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * figure_size[0],
-            renderer_options_wid.selected_values["zoom_one"] * figure_size[1],
+            renderer_options["zoom_one"] * figure_size[0],
+            renderer_options["zoom_one"] * figure_size[1],
         )
 
         # Render shape with selected options
@@ -834,74 +990,72 @@ def visualize_atm(
             renderer=save_figure_wid.renderer,
             image_is_masked=image_is_masked,
             figure_size=new_figure_size,
-            **options
+            **options,
         )
 
         # Update info
         update_info(atm, instance, level, g)
 
     # Define function that updates the info text
+    # The model's info only depends on the level and the landmark group, so
+    # it is built once per (level, group) pair
+    model_info_text = {}
+    pixels_range = _pixels_range_function()
+
     def update_info(atm, instance, level, group):
-        lvl_shape_mod = atm.shape_models[level].model
-        tmplt_inst = atm.warped_templates[level]
-        n_channels = tmplt_inst.n_channels
-        feat = atm.holistic_features[level]
+        if (level, group) not in model_info_text:
+            feat_name, n_components, variance, n_true_pixels, str_shape = levels_info[
+                level
+            ]
+            n_channels = levels_metadata[level][1]
 
-        # Feature string
-        tmp_feat = "Feature is {} with {} channel{}".format(
-            name_of_callable(feat), n_channels, "s" * (n_channels > 1)
-        )
+            # Feature string
+            tmp_feat = "Feature is {} with {} channel{}".format(
+                feat_name, n_channels, "s" * (n_channels > 1)
+            )
+            model_info_text[level, group] = [
+                "> Warp using {} transform".format(atm.transform.__name__),
+                "> Level {}/{}".format(level + 1, atm.n_scales),
+                "> {} landmark points".format(instance.landmarks[group].n_points),
+                "> {} shape components ({:.2f}% of variance)".format(
+                    n_components, variance
+                ),
+                "> {}".format(tmp_feat),
+                "> Reference frame of length {} ({} x {}C, {} x {}C)".format(
+                    n_true_pixels * n_channels,
+                    n_true_pixels,
+                    n_channels,
+                    str_shape,
+                    n_channels,
+                ),
+            ]
 
         # update info widgets
-        text_per_line = [
-            "> Warp using {} transform".format(atm.transform.__name__),
-            "> Level {}/{}".format(level + 1, atm.n_scales),
-            "> {} landmark points".format(instance.landmarks[group].n_points),
-            "> {} shape components ({:.2f}% of variance)".format(
-                lvl_shape_mod.n_components, lvl_shape_mod.variance_ratio() * 100
-            ),
-            "> {}".format(tmp_feat),
-            "> Reference frame of length {} ({} x {}C, {} x {}C)".format(
-                tmplt_inst.n_true_pixels() * n_channels,
-                tmplt_inst.n_true_pixels(),
-                n_channels,
-                tmplt_inst._str_shape(),
-                n_channels,
-            ),
-            "> Instance: min={:.3f} , max={:.3f}".format(
-                instance.pixels.min(), instance.pixels.max()
-            ),
+        text_per_line = model_info_text[level, group] + [
+            "> Instance: min={:.3f} , max={:.3f}".format(*pixels_range(instance))
         ]
         info_wid.set_widget_state(text_per_line=text_per_line)
 
     @output.capture(clear_output=True, wait=True)
     def plot_shape_variance(name):
         # Get selected level
-        level = level_wid.value if n_levels > 1 else 0
+        level = level_wid.value if level_wid is not None else 0
 
         # Render
-        new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * 10,
-            renderer_options_wid.selected_values["zoom_one"] * 3,
-        )
-        plt.subplot(121)
-        save_figure_wid.renderer = atm.shape_models[level].model.plot_eigenvalues_ratio(
-            figure_id=save_figure_wid.renderer.figure_id, new_figure=False
-        )
-        plt.subplot(122)
-        save_figure_wid.renderer = atm.shape_models[
-            level
-        ].model.plot_eigenvalues_cumulative_ratio(
-            figure_id=save_figure_wid.renderer.figure_id,
-            new_figure=False,
-            figure_size=new_figure_size,
+        _plot_pca_variance(
+            atm.shape_models[level].model,
+            renderer_options_wid.selected_values["zoom_one"],
+            save_figure_wid,
         )
-        save_figure_wid.renderer.force_draw()
+
+    # Coalesce the render calls that are triggered while dragging a slider
+    debounced_render_function = debounce(render_function)
 
     # Create widgets
+    level_wid = _build_level_radio(n_levels, initial_level)
     shape_model_parameters_wid = LinearModelParametersWidget(
-        n_shape_parameters[0],
-        render_function,
+        n_shape_parameters[initial_level],
+        debounced_render_function,
         params_str="Parameter ",
         mode=mode,
         params_bounds=parameters_bounds,
@@ -910,101 +1064,70 @@ def visualize_atm(
         plot_variance_function=plot_shape_variance,
         animation_step=0.5,
         interval=0.0,
-        loop_enabled=True,
-    )
-    groups_keys, labels_keys = extract_groups_labels_from_image(atm.warped_templates[0])
-    image_options_wid = ImageOptionsWidget(
-        n_channels=atm.warped_templates[0].n_channels,
-        image_is_masked=isinstance(atm.warped_templates[0], MaskedImage),
-        render_function=render_function,
-    )
-    landmark_options_wid = LandmarkOptionsWidget(
-        group_keys=groups_keys,
-        labels_keys=labels_keys,
-        type="2D",
-        render_function=render_function,
-    )
-    renderer_options_wid = RendererOptionsWidget(
-        options_tabs=["zoom_one", "axes", "numbering_matplotlib", "legend"],
-        labels=None,
-        axes_x_limits=None,
-        axes_y_limits=None,
-        render_function=render_function,
-    )
-    info_wid = TextPrintWidget(text_per_line=[""])
-    save_figure_wid = SaveMatplotlibFigureOptionsWidget()
-
-    # Group widgets
-    tmp_children = [shape_model_parameters_wid]
-    if n_levels > 1:
-        # Define function that updates options' widgets state
-        def update_widgets(change):
-            value = change["new"]
-            # Update shape model parameters
-            shape_model_parameters_wid.set_widget_state(
-                n_shape_parameters[value], params_str="Parameter ", allow_callback=False
-            )
-
-            # Update landmarks options
-            g_keys, l_keys = extract_groups_labels_from_image(
-                atm.warped_templates[value]
-            )
-            landmark_options_wid.set_widget_state(
-                group_keys=g_keys, labels_keys=l_keys, allow_callback=False
-            )
-
-            # Update channel options
-            image_options_wid.set_widget_state(
-                n_channels=atm.warped_templates[value].n_channels,
-                image_is_masked=isinstance(atm.warped_templates[value], MaskedImage),
-                allow_callback=True,
-            )
+        loop_enabled=True,
+    )
+    (groups_keys, labels_keys), n_channels, image_is_masked = levels_metadata[
+        initial_level
+    ]
+    image_options_wid = ImageOptionsWidget(
+        n_channels=n_channels,
+        image_is_masked=image_is_masked,
+        render_function=debounced_render_function,
+    )
+    landmark_options_wid = LandmarkOptionsWidget(
+        group_keys=groups_keys,
+        labels_keys=labels_keys,
+        type="2D",
+        render_function=debounced_render_function,
+    )
+    renderer_options_wid = RendererOptionsWidget(
+        options_tabs=["zoom_one", "axes", "numbering_matplotlib", "legend"],
+        labels=None,
+        axes_x_limits=None,
+        axes_y_limits=None,
+        render_function=debounced_render_function,
+    )
+    info_wid = TextPrintWidget(text_per_line=[""])
+    # The export options are only built once their tab gets selected
+    save_figure_wid = _DeferredSaveFigure()
+
+    def build_save_figure_wid():
+        nonlocal save_figure_wid
+        save_figure_wid = SaveMatplotlibFigureOptionsWidget(save_figure_wid.renderer)
+        return save_figure_wid
+
+    # Define function that updates the options' widgets state of a level
+    def update_options_widgets(level):
+        # Update landmarks options
+        (g_keys, l_keys), n_channels, image_is_masked = levels_metadata[level]
+        landmark_options_wid.set_widget_state(
+            group_keys=g_keys, labels_keys=l_keys, allow_callback=False
+        )
 
-        # Create pyramid radiobuttons
-        radio_str = OrderedDict()
-        for l in range(n_levels):
-            if l == 0:
-                radio_str["Level {} (low)".format(l)] = l
-            elif l == n_levels - 1:
-                radio_str["Level {} (high)".format(l)] = l
-            else:
-                radio_str["Level {}".format(l)] = l
-        level_wid = ipywidgets.RadioButtons(
-            options=radio_str,
-            description="Pyramid",
-            value=n_levels - 1,
-            layout=ipywidgets.Layout(width="6cm"),
+        # Update channel options
+        image_options_wid.set_widget_state(
+            n_channels=n_channels,
+            image_is_masked=image_is_masked,
+            allow_callback=False,
         )
-        level_wid.observe(update_widgets, names="value", type="change")
-        level_wid.observe(render_function, names="value", type="change")
-        tmp_children.insert(0, level_wid)
-    tmp_wid = ipywidgets.HBox(tmp_children)
-    options_box = ipywidgets.Tab(
+
+    # Group widgets and display them
+    _build_model_widget_layout(
+        output,
+        level_wid,
+        (shape_model_parameters_wid,),
+        (n_shape_parameters,),
         [
-            tmp_wid,
             image_options_wid,
             landmark_options_wid,
             renderer_options_wid,
             info_wid,
-            save_figure_wid,
-        ]
+            build_save_figure_wid,
+        ],
+        _MODEL_TAB_TITLES,
+        update_options_widgets,
+        debounced_render_function,
     )
-    tab_titles = ["Model", "Image", "Landmarks", "Renderer", "Info", "Export"]
-    for k, tl in enumerate(tab_titles):
-        options_box.set_title(k, tl)
-    logo_wid = LogoWidget(style=main_style)
-    logo_wid.layout.margin = "0px 10px 0px 0px"
-    output.layout.align_self = "center"
-    wid = ipywidgets.HBox([logo_wid, options_box, output])
-
-    # Set widget's style
-    wid.box_style = main_style
-    wid.layout.border = "2px solid " + map_styles_to_hex_colours(main_style)
-
-    # Display final widget
-    final_box = ipywidgets.Box([wid])
-    final_box.layout.display = "flex"
-    ipydisplay.display(final_box)
 
     # Trigger initial visualization
     render_function({})
@@ -1044,9 +1167,6 @@ def visualize_patch_atm(
     # Get the number of levels
     n_levels = atm.n_scales
 
-    # Define the styling options
-    main_style = "info"
-
     # Get the maximum number of components per level
     max_n_shape = [sp.n_active_components for sp in atm.shape_models]
 
@@ -1054,120 +1174,148 @@ def visualize_patch_atm(
     # of len n_scales)
     n_shape_parameters = check_n_parameters(n_shape_parameters, n_levels, max_n_shape)
 
+    # Get the (n_patches, n_offsets, n_channels, height, width) shape of each
+    # level's patches
+    pixels_shapes = [template.pixels.shape for template in atm.warped_templates]
+    # Single precision copies of each level's patches. This is enough for
+    # displaying them and halves the size of the image they get composed into.
+    single_patches = {}
+    # Get the properties of each level that are reported in the info text
+    levels_info = [
+        (name_of_callable(feat), sp.model.n_components, sp.model.variance_ratio() * 100)
+        for feat, sp in zip(atm.holistic_features, atm.shape_models)
+    ]
+
+    # The widget starts from the highest pyramid level, so build the options'
+    # widgets directly for it
+    initial_level = n_levels - 1
+
     output = ipywidgets.Output()
 
+    # Keep the most recently generated instances, since most of the options'
+    # changes do not affect them
+    instance_cache = OrderedDict()
+
+    def get_instance(level, shape_weights):
+        key = (level, tuple(shape_weights))
+        if key in instance_cache:
+            instance_cache.move_to_end(key)
+        else:
+            instance_cache[key] = atm.instance(
+                shape_weights=shape_weights, scale_index=level
+            )
+            if len(instance_cache) > _INSTANCE_CACHE_SIZE:
+                instance_cache.popitem(last=False)
+        return instance_cache[key]
+
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
         # Get selected level
-        level = level_wid.value if n_levels > 1 else 0
+        level = level_wid.value if level_wid is not None else 0
 
         # Compute weights and instance
         shape_weights = shape_model_parameters_wid.selected_values
-        shape_instance, template = atm.instance(
-            scale_index=level, shape_weights=shape_weights
-        )
+        shape_instance, template = get_instance(level, shape_weights)
+        shape_options = shape_options_wid.selected_values
+        renderer_options = renderer_options_wid.selected_values
 
         # Create options dictionary
-        options = dict()
-        options.update(shape_options_wid.selected_values["lines"])
-        options.update(shape_options_wid.selected_values["markers"])
-        options.update(renderer_options_wid.selected_values["numbering_matplotlib"])
-        options.update(renderer_options_wid.selected_values["axes"])
-        image_options = dict(image_options_wid.selected_values)
-        del image_options["masked_enabled"]
-        options.update(image_options)
-        options.update(patch_options_wid.selected_values)
+        options = {
+            **shape_options["lines"],
+            **shape_options["markers"],
+            **renderer_options["numbering_matplotlib"],
+            **renderer_options["axes"],
+            **image_options_wid.selected_values,
+            **patch_options_wid.selected_values,
+        }
+        del options["masked_enabled"]
         options["line_colour"] = options["line_colour"][0]
         options["marker_face_colour"] = options["marker_face_colour"][0]
         options["marker_edge_colour"] = options["marker_edge_colour"][0]
 
         # Get figure size
         new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * figure_size[0],
-            renderer_options_wid.selected_values["zoom_one"] * figure_size[1],
+            renderer_options["zoom_one"] * figure_size[0],
+            renderer_options["zoom_one"] * figure_size[1],
         )
 
         # show image with selected options
+        if level not in single_patches:
+            single_patches[level] = template.pixels.astype(np.float32)
         save_figure_wid.renderer = render_patches(
-            patches=template.pixels,
+            patches=single_patches[level],
             patch_centers=shape_instance,
             renderer=save_figure_wid.renderer,
             figure_size=new_figure_size,
-            **options
+            **options,
         )
 
         # Update info
         update_info(atm, template, level)
 
     # Define function that updates the info text
-    def update_info(atm, instance, level):
-        lvl_shape_mod = atm.shape_models[level].model
-        n_channels = instance.pixels.shape[2]
-        feat = atm.holistic_features[level]
+    # The patches of a level are its warped template, whatever the shape
+    # weights, so the whole info text is built once per level
+    model_info_text = {}
 
-        # Feature string
-        tmp_feat = "Feature is {} with {} channel{}".format(
-            name_of_callable(feat), n_channels, "s" * (n_channels > 1)
-        )
-        n_feat = (
-            instance.pixels.shape[0]
-            * instance.pixels.shape[2]
-            * instance.pixels.shape[3]
-            * instance.pixels.shape[4]
-        )
+    def update_info(atm, instance, level):
+        if level not in model_info_text:
+            feat_name, n_components, variance = levels_info[level]
+            pixels_shape = pixels_shapes[level]
+            n_channels = pixels_shape[2]
+
+            # Feature string
+            tmp_feat = "Feature is {} with {} channel{}".format(
+                feat_name, n_channels, "s" * (n_channels > 1)
+            )
+            n_feat = (
+                pixels_shape[0] * pixels_shape[2] * pixels_shape[3] * pixels_shape[4]
+            )
+            model_info_text[level] = [
+                "> Warp using {} transform".format(atm.transform.__name__),
+                "> Level {}/{}".format(level + 1, atm.n_scales),
+                "> {} landmark points".format(pixels_shape[0]),
+                "> {} shape components ({:.2f}% of variance)".format(
+                    n_components, variance
+                ),
+                "> {}".format(tmp_feat),
+                "> Reference frame of length {} ({} patches of shape {} x {} "
+                "and {} channel{}.)".format(
+                    n_feat,
+                    pixels_shape[0],
+                    pixels_shape[3],
+                    pixels_shape[4],
+                    n_channels,
+                    "s" * (n_channels > 1),
+                ),
+                "> Instance: min={:.3f} , max={:.3f}".format(
+                    instance.pixels.min(), instance.pixels.max()
+                ),
+            ]
 
         # update info widgets
-        text_per_line = [
-            "> Warp using {} transform".format(atm.transform.__name__),
-            "> Level {}/{}".format(level + 1, atm.n_scales),
-            "> {} landmark points".format(instance.pixels.shape[0]),
-            "> {} shape components ({:.2f}% of variance)".format(
-                lvl_shape_mod.n_components, lvl_shape_mod.variance_ratio() * 100
-            ),
-            "> {}".format(tmp_feat),
-            "> Reference frame of length {} ({} patches of shape {} x {} "
-            "and {} channel{}.)".format(
-                n_feat,
-                instance.pixels.shape[0],
-                instance.pixels.shape[3],
-                instance.pixels.shape[4],
-                instance.pixels.shape[2],
-                "s" * (instance.pixels.shape[2] > 1),
-            ),
-            "> Instance: min={:.3f} , max={:.3f}".format(
-                instance.pixels.min(), instance.pixels.max()
-            ),
-        ]
-        info_wid.set_widget_state(text_per_line=text_per_line)
+        info_wid.set_widget_state(text_per_line=model_info_text[level])
 
     @output.capture(clear_output=True, wait=True)
     def plot_shape_variance(name):
         # Get selected level
-        level = level_wid.value if n_levels > 1 else 0
+        level = level_wid.value if level_wid is not None else 0
 
         # Render
-        new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * 10,
-            renderer_options_wid.selected_values["zoom_one"] * 3,
-        )
-        plt.subplot(121)
-        save_figure_wid.renderer = atm.shape_models[level].model.plot_eigenvalues_ratio(
-            figure_id=save_figure_wid.renderer.figure_id, new_figure=False
-        )
-        plt.subplot(122)
-        save_figure_wid.renderer = atm.shape_models[
-            level
-        ].model.plot_eigenvalues_cumulative_ratio(
-            figure_id=save_figure_wid.renderer.figure_id,
-            new_figure=False,
-            figure_size=new_figure_size,
+        _plot_pca_variance(
+            atm.shape_models[level].model,
+            renderer_options_wid.selected_values["zoom_one"],
+            save_figure_wid,
         )
-        save_figure_wid.renderer.force_draw()
+
+    # Coalesce the render calls that are triggered while dragging a slider
+    debounced_render_function = debounce(render_function)
 
     # Create widgets
+    level_wid = _build_level_radio(n_levels, initial_level)
     shape_model_parameters_wid = LinearModelParametersWidget(
-        n_shape_parameters[0],
-        render_function,
+        n_shape_parameters[initial_level],
+        debounced_render_function,
         params_str="Parameter ",
         mode=mode,
         params_bounds=parameters_bounds,
@@ -1180,100 +1328,71 @@ def visualize_patch_atm(
     )
     shape_options_wid = Shape2DOptionsWidget(labels=None, render_function=None)
     shape_options_wid.line_options_wid.render_lines_switch.button_wid.value = False
-    shape_options_wid.add_render_function(render_function)
+    shape_options_wid.add_render_function(debounced_render_function)
+    initial_pixels_shape = pixels_shapes[initial_level]
     patch_options_wid = PatchOptionsWidget(
-        n_patches=atm.warped_templates[0].pixels.shape[0],
-        n_offsets=atm.warped_templates[0].pixels.shape[1],
-        render_function=render_function,
+        n_patches=initial_pixels_shape[0],
+        n_offsets=initial_pixels_shape[1],
+        render_function=debounced_render_function,
     )
     image_options_wid = ImageOptionsWidget(
-        n_channels=atm.warped_templates[0].pixels.shape[2],
+        n_channels=initial_pixels_shape[2],
         image_is_masked=False,
         render_function=None,
     )
     image_options_wid.interpolation_checkbox.button_wid.value = False
-    image_options_wid.add_render_function(render_function)
+    image_options_wid.add_render_function(debounced_render_function)
     renderer_options_wid = RendererOptionsWidget(
         options_tabs=["zoom_one", "axes", "numbering_matplotlib"],
         labels=None,
         axes_x_limits=None,
         axes_y_limits=None,
-        render_function=render_function,
+        render_function=debounced_render_function,
     )
     info_wid = TextPrintWidget(text_per_line=[""])
-    save_figure_wid = SaveMatplotlibFigureOptionsWidget()
-
-    # Group widgets
-    tmp_children = [shape_model_parameters_wid]
-    if n_levels > 1:
-        # Define function that updates options' widgets state
-        def update_widgets(change):
-            value = change["new"]
-            # Update shape model parameters
-            shape_model_parameters_wid.set_widget_state(
-                n_shape_parameters[value], params_str="Parameter ", allow_callback=False
-            )
-
-            # Update patch options
-            patch_options_wid.set_widget_state(
-                n_patches=atm.warped_templates[value].pixels.shape[0],
-                n_offsets=atm.warped_templates[value].pixels.shape[1],
-                allow_callback=False,
-            )
-
-            # Update channels options
-            image_options_wid.set_widget_state(
-                n_channels=atm.warped_templates[value].pixels.shape[2],
-                image_is_masked=False,
-                allow_callback=True,
-            )
+    # The export options are only built once their tab gets selected
+    save_figure_wid = _DeferredSaveFigure()
+
+    def build_save_figure_wid():
+        nonlocal save_figure_wid
+        save_figure_wid = SaveMatplotlibFigureOptionsWidget(save_figure_wid.renderer)
+        return save_figure_wid
+
+    # Define function that updates the options' widgets state of a level
+    def update_options_widgets(level):
+        # Update patch options
+        pix_shape = pixels_shapes[level]
+        patch_options_wid.set_widget_state(
+            n_patches=pix_shape[0],
+            n_offsets=pix_shape[1],
+            allow_callback=False,
+        )
 
-        # Pyramid radiobuttons
-        radio_str = OrderedDict()
-        for l in range(n_levels):
-            if l == 0:
-                radio_str["Level {} (low)".format(l)] = l
-            elif l == n_levels - 1:
-                radio_str["Level {} (high)".format(l)] = l
-            else:
-                radio_str["Level {}".format(l)] = l
-        level_wid = ipywidgets.RadioButtons(
-            options=radio_str,
-            description="Pyramid",
-            value=n_levels - 1,
-            layout=ipywidgets.Layout(width="6cm"),
+        # Update channels options
+        image_options_wid.set_widget_state(
+            n_channels=pix_shape[2],
+            image_is_masked=False,
+            allow_callback=False,
         )
-        level_wid.observe(update_widgets, names="value", type="change")
-        level_wid.observe(render_function, names="value", type="change")
-        tmp_children.insert(0, level_wid)
-    tmp_wid = ipywidgets.HBox(tmp_children)
-    options_box = ipywidgets.Tab(
+
+    # Group widgets and display them
+    _build_model_widget_layout(
+        output,
+        level_wid,
+        (shape_model_parameters_wid,),
+        (n_shape_parameters,),
         [
-            tmp_wid,
             patch_options_wid,
             image_options_wid,
             shape_options_wid,
             renderer_options_wid,
             info_wid,
-            save_figure_wid,
-        ]
+            build_save_figure_wid,
+        ],
+        _PATCH_ATM_TAB_TITLES,
+        update_options_widgets,
+        debounced_render_function,
     )
-    tab_titles = ["Model", "Patches", "Image", "Shape", "Renderer", "Info", "Export"]
-    for k, tl in enumerate(tab_titles):
-        options_box.set_title(k, tl)
-    logo_wid = LogoWidget(style=main_style)
-    logo_wid.layout.margin = "0px 10px 0px 0px"
-    output.layout.align_self = "center"
-    wid = ipywidgets.HBox([logo_wid, options_box, output])
-
-    # Set widget's style
-    wid.box_style = main_style
-    wid.layout.border = "2px solid " + map_styles_to_hex_colours(main_style)
-
-    # Display final widget
-    final_box = ipywidgets.Box([wid])
-    final_box.layout.display = "flex"
-    ipydisplay.display(final_box)
 
     # Trigger initial visualization
     render_function({})
@@ -1372,7 +1491,7 @@ def visualize_clm(
             patch_centers=shape_instance,
             renderer=save_figure_wid.renderer,
             figure_size=new_figure_size,
-            **options
+            **options,
         )
 
         # Update info
@@ -1416,23 +1535,11 @@ def visualize_clm(
         level = level_wid.value if n_levels > 1 else 0
 
         # Render
-        new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * 10,
-            renderer_options_wid.selected_values["zoom_one"] * 3,
-        )
-        plt.subplot(121)
-        save_figure_wid.renderer = clm.shape_models[level].model.plot_eigenvalues_ratio(
-            figure_id=save_figure_wid.renderer.figure_id, new_figure=False
-        )
-        plt.subplot(122)
-        save_figure_wid.renderer = clm.shape_models[
-            level
-        ].model.plot_eigenvalues_cumulative_ratio(
-            figure_id=save_figure_wid.renderer.figure_id,
-            new_figure=False,
-            figure_size=new_figure_size,
+        _plot_pca_variance(
+            clm.shape_models[level].model,
+            renderer_options_wid.selected_values["zoom_one"],
+            save_figure_wid,
         )
-        save_figure_wid.renderer.force_draw()
 
     # Create widgets
     shape_model_parameters_wid = LinearModelParametersWidget(
@@ -1510,14 +1617,7 @@ def visualize_clm(
             )
 
         # Pyramid radiobuttons
-        radio_str = OrderedDict()
-        for l in range(n_levels):
-            if l == 0:
-                radio_str["Level {} (low)".format(l)] = l
-            elif l == n_levels - 1:
-                radio_str["Level {} (high)".format(l)] = l
-            else:
-                radio_str["Level {}".format(l)] = l
+        radio_str = _pyramid_levels_options(n_levels)
         level_wid = ipywidgets.RadioButtons(
             options=radio_str,
             description="Pyramid",
@@ -1637,7 +1737,7 @@ def visualize_expert_ensemble(expert_ensemble, centers, figure_size=(7, 7)):
             patch_centers=centers[level],
             renderer=save_figure_wid.renderer,
             figure_size=new_figure_size,
-            **options
+            **options,
         )
 
         # Update info
@@ -1714,14 +1814,7 @@ def visualize_expert_ensemble(expert_ensemble, centers, figure_size=(7, 7)):
             )
 
         # Create pyramid radiobuttons
-        radio_str = OrderedDict()
-        for l in range(n_levels):
-            if l == 0:
-                radio_str["Level {} (low)".format(l)] = l
-            elif l == n_levels - 1:
-                radio_str["Level {} (high)".format(l)] = l
-            else:
-                radio_str["Level {}".format(l)] = l
+        radio_str = _pyramid_levels_options(n_levels)
         level_wid = ipywidgets.RadioButtons(
             options=radio_str,
             description="Pyramid",
@@ -1805,8 +1898,6 @@ def plot_ced(
         as part of a parent widget. If ``False``, the widget object is not
         returned, it is just visualized.
     """
-    from menpofit.visualize import plot_cumulative_error_distribution
-
     # Make sure that errors is a list even with one list member
     if not isinstance(errors[0], Sized):
         errors = [errors]
@@ -1814,6 +1905,10 @@ def plot_ced(
     # Get number of curves to be plotted
     n_curves = len(errors)
 
+    # Get the maximum error of all curves. It is the horizontal axis limit when
+    # the axes limits are given as a percentage.
+    max_error = max(np.max(e) for e in errors)
+
     # Define the styling options
     main_style = "danger"
 
@@ -1852,7 +1947,7 @@ def plot_ced(
         if opts["axes_x_limits"] is None:
             tmp_error_range = None
         elif isinstance(opts["axes_x_limits"], float):
-            tmp_error_range = [0.0, np.max(errors), x_axis_step]
+            tmp_error_range = [0.0, max_error, x_axis_step]
         else:
             tmp_error_range = [
                 opts["axes_x_limits"][0],
@@ -1865,7 +1960,7 @@ def plot_ced(
             figure_id=save_figure_wid.renderer.figure_id,
             new_figure=False,
             figure_size=new_figure_size,
-            **opts
+            **opts,
         )
 
         # show plot
@@ -1894,22 +1989,16 @@ def plot_ced(
 
     plot_wid.axes_wid.axes_ticks_widget.axes_y_ticks_toggles.value = "list"
     plot_wid.axes_wid.axes_ticks_widget.axes_y_ticks_list.set_widget_state(
-        list(np.arange(0.0, 1.1, 0.1)), allow_callback=False
+        list(_CED_Y_TICKS), allow_callback=False
     )
     plot_wid.add_render_function(render_function)
 
     # Group widgets
     logo = LogoWidget(style=main_style)
     logo.layout.margin = "0px 10px 0px 0px"
-    tmp_children = list(plot_wid.tab_box.children)
-    tmp_children.append(save_figure_wid)
-    plot_wid.tab_box.children = tmp_children
-    plot_wid.tab_box.set_title(0, "Labels")
-    plot_wid.tab_box.set_title(1, "Style")
-    plot_wid.tab_box.set_title(2, "Legend")
-    plot_wid.tab_box.set_title(3, "Axes")
-    plot_wid.tab_box.set_title(4, "Zoom")
-    plot_wid.tab_box.set_title(5, "Grid")
+    # Append the export tab. The titles of the rest of the tabs are already
+    # set by the PlotMatplotlibOptionsWidget.
+    plot_wid.tab_box.children = (*plot_wid.tab_box.children, save_figure_wid)
     plot_wid.tab_box.set_title(6, "Export")
 
     # Display final widget
@@ -1962,62 +2051,53 @@ def visualize_fitting_results(
     # Get the number of fitting_results
     n_fitting_results = len(fitting_results)
 
+    # The properties of each fitting result that the widgets depend on. They
+    # are gathered the first time that a result gets selected.
+    results_properties = {}
+
+    def get_result_properties(i):
+        if i not in results_properties:
+            fr = fitting_results[i]
+            results_properties[i] = {
+                "has_gt_shape": fr.gt_shape is not None,
+                "has_initial_shape": fr.initial_shape is not None,
+                "has_image": fr.image is not None,
+                "n_shapes": len(fr.shapes) if fr.is_iterative else None,
+                "has_costs": fr.is_iterative and fr.costs is not None,
+            }
+        return results_properties[i]
+
     # Define the styling options
     main_style = "info"
 
     output = ipywidgets.Output()
 
-    @output.capture(clear_output=True, wait=True)
-    def plot_errors_function(name):
-        # Get selected index
-        i = image_number_wid.selected_values if n_fitting_results > 1 else 0
-
-        # Render
-        new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * 10,
-            renderer_options_wid.selected_values["zoom_one"] * 3,
-        )
-        save_figure_wid.renderer = fitting_results[i].plot_errors(
-            figure_id=save_figure_wid.renderer.figure_id,
-            new_figure=False,
-            figure_size=new_figure_size,
-        )
-        save_figure_wid.renderer.force_draw()
-
-    @output.capture(clear_output=True, wait=True)
-    def plot_displacements_function(name):
-        # Get selected index
-        i = image_number_wid.selected_values if n_fitting_results > 1 else 0
-
-        # Render
-        new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * 10,
-            renderer_options_wid.selected_values["zoom_one"] * 3,
-        )
-        save_figure_wid.renderer = fitting_results[i].plot_displacements(
-            figure_id=save_figure_wid.renderer.figure_id,
-            new_figure=False,
-            figure_size=new_figure_size,
-            stat_type="mean",
-        )
-        save_figure_wid.renderer.force_draw()
+    def create_plot_function(plot_method_name, **plot_kwargs):
+        # Creates the callback that renders the given plot method of the
+        # selected fitting result
+        @output.capture(clear_output=True, wait=True)
+        def plot_function(name):
+            # Get selected index
+            i = image_number_wid.selected_values if n_fitting_results > 1 else 0
+
+            # Render
+            zoom = renderer_options_wid.selected_values["zoom_one"]
+            plot_method = getattr(fitting_results[i], plot_method_name)
+            save_figure_wid.renderer = plot_method(
+                figure_id=save_figure_wid.renderer.figure_id,
+                new_figure=False,
+                figure_size=(zoom * 10, zoom * 3),
+                **plot_kwargs,
+            )
+            save_figure_wid.renderer.force_draw()
 
-    @output.capture(clear_output=True, wait=True)
-    def plot_costs_function(name):
-        # Get selected index
-        im = image_number_wid.selected_values if n_fitting_results > 1 else 0
+        return plot_function
 
-        # Render
-        new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * 10,
-            renderer_options_wid.selected_values["zoom_one"] * 3,
-        )
-        save_figure_wid.renderer = fitting_results[im].plot_costs(
-            figure_id=save_figure_wid.renderer.figure_id,
-            new_figure=False,
-            figure_size=new_figure_size,
-        )
-        save_figure_wid.renderer.force_draw()
+    plot_errors_function = create_plot_function("plot_errors")
+    plot_displacements_function = create_plot_function(
+        "plot_displacements", stat_type="mean"
+    )
+    plot_costs_function = create_plot_function("plot_costs")
 
     @output.capture(clear_output=True, wait=True)
     def render_function(change):
@@ -2025,22 +2105,27 @@ def visualize_fitting_results(
         i = image_number_wid.selected_values if n_fitting_results > 1 else 0
 
         # get selected options
-        tmp1 = renderer_options_wid.selected_values["markers_matplotlib"]
-        tmp2 = renderer_options_wid.selected_values["lines_matplotlib"]
-        options = fitting_result_wid.selected_values
-        options.update(renderer_options_wid.selected_values["axes"])
-        options.update(renderer_options_wid.selected_values["legend"])
-        options.update(renderer_options_wid.selected_values["numbering_matplotlib"])
-        options.update(renderer_options_wid.selected_values["image_matplotlib"])
+        renderer_options = renderer_options_wid.selected_values
+        result_options = fitting_result_wid.selected_values
+        tmp1 = renderer_options["markers_matplotlib"]
+        tmp2 = renderer_options["lines_matplotlib"]
+        options = {
+            **result_options,
+            **renderer_options["axes"],
+            **renderer_options["legend"],
+            **renderer_options["numbering_matplotlib"],
+            **renderer_options["image_matplotlib"],
+        }
         new_figure_size = (
-            renderer_options_wid.selected_values["zoom_one"] * figure_size[0],
-            renderer_options_wid.selected_values["zoom_one"] * figure_size[1],
+            renderer_options["zoom_one"] * figure_size[0],
+            renderer_options["zoom_one"] * figure_size[1],
         )
 
         # get selected view function
+        properties = get_result_properties(i)
         if (
             fitting_result_wid.result_iterations_tab.selected_index == 0
-            or not fitting_results[i].is_iterative
+            or properties["n_shapes"] is None
         ):
             # use view()
             # final shape colour
@@ -2051,7 +2136,7 @@ def visualize_fitting_results(
             initial_marker_face_colour = "b"
             initial_marker_edge_colour = "b"
             initial_line_colour = "b"
-            if fitting_results[i].initial_shape is not None:
+            if properties["has_initial_shape"]:
                 initial_marker_face_colour = tmp1["marker_face_colour"][1]
                 initial_marker_edge_colour = tmp1["marker_edge_colour"][1]
                 initial_line_colour = tmp2["line_colour"][1]
@@ -2059,8 +2144,8 @@ def visualize_fitting_results(
             gt_marker_face_colour = "y"
             gt_marker_edge_colour = "y"
             gt_line_colour = "y"
-            if fitting_results[i].gt_shape is not None:
-                if fitting_results[i].initial_shape is not None:
+            if properties["has_gt_shape"]:
+                if properties["has_initial_shape"]:
                     gt_marker_face_colour = tmp1["marker_face_colour"][2]
                     gt_marker_edge_colour = tmp1["marker_edge_colour"][2]
                     gt_line_colour = tmp2["line_colour"][2]
@@ -2089,7 +2174,7 @@ def visualize_fitting_results(
                 line_style=tmp2["line_style"],
                 line_width=tmp2["line_width"],
                 figure_size=new_figure_size,
-                **options
+                **options,
             )
         else:
             # use view_iterations()
@@ -2103,17 +2188,12 @@ def visualize_fitting_results(
                 # The mode is 'Static'
                 # get colours
                 marker_face_colour = [
-                    tmp1["marker_face_colour"][i]
-                    for i in fitting_result_wid.selected_values["iters"]
+                    tmp1["marker_face_colour"][i] for i in result_options["iters"]
                 ]
                 marker_edge_colour = [
-                    tmp1["marker_edge_colour"][i]
-                    for i in fitting_result_wid.selected_values["iters"]
-                ]
-                line_colour = [
-                    tmp2["line_colour"][i]
-                    for i in fitting_result_wid.selected_values["iters"]
+                    tmp1["marker_edge_colour"][i] for i in result_options["iters"]
                 ]
+                line_colour = [tmp2["line_colour"][i] for i in result_options["iters"]]
 
             # render
             save_figure_wid.renderer = fitting_results[i].view_iterations(
@@ -2130,7 +2210,7 @@ def visualize_fitting_results(
                 line_width=tmp2["line_width"],
                 line_colour=line_colour,
                 figure_size=new_figure_size,
-                **options
+                **options,
             )
 
         # Show figure
@@ -2139,6 +2219,24 @@ def visualize_fitting_results(
         # update info text widget
         update_info({}, custom_info_callback=custom_info_callback)
 
+    # The fitting results do not change during the widget's lifetime, so the
+    # errors of each result are computed once per error and normalisation type
+    errors_cache = {}
+
+    def get_errors(im, error_type, norm_type):
+        key = (im, error_type, norm_type)
+        if key not in errors_cache:
+            fr = fitting_results[im]
+            error_fun = _ERROR_FUNCTIONS[error_type]
+            initial_error = None
+            if fr.initial_shape is not None:
+                initial_error = error_fun(
+                    fr.initial_shape, fr.gt_shape, norm_type=norm_type
+                )
+            final_error = error_fun(fr.final_shape, fr.gt_shape, norm_type=norm_type)
+            errors_cache[key] = (initial_error, final_error)
+        return errors_cache[key]
+
     # Define function that updates info text
     def update_info(change, custom_info_callback=None):
         # Get selected object
@@ -2147,31 +2245,16 @@ def visualize_fitting_results(
 
         # Errors
         text_per_line = []
-        if fr.gt_shape is not None:
-            # Get error function
-            error_fun = euclidean_bb_normalised_error
-            if error_type_toggles.value == "RMS":
-                error_fun = root_mean_square_bb_normalised_error
+        if get_result_properties(im)["has_gt_shape"]:
             # Set error options visibility
             error_box.layout.visibility = "visible"
-            # Compute errors
-            if fr.initial_shape is not None:
-                text_per_line.append(
-                    " > Initial error: {:.4f}".format(
-                        error_fun(
-                            fr.initial_shape,
-                            fr.gt_shape,
-                            norm_type=norm_type_toggles.value,
-                        )
-                    )
-                )
-            text_per_line.append(
-                " > Final error: {:.4f}".format(
-                    error_fun(
-                        fr.final_shape, fr.gt_shape, norm_type=norm_type_toggles.value
-                    )
-                )
+            # Get errors
+            initial_error, final_error = get_errors(
+                im, error_type_toggles.value, norm_type_toggles.value
             )
+            if initial_error is not None:
+                text_per_line.append(" > Initial error: {:.4f}".format(initial_error))
+            text_per_line.append(" > Final error: {:.4f}".format(final_error))
         else:
             # Set error options visibility
             error_box.layout.visibility = "hidden"
@@ -2195,10 +2278,10 @@ def visualize_fitting_results(
     # Create renderer widget
     labels = ["Final"]
     default_colours = ["red"]
-    if fitting_results[0].initial_shape is not None:
+    if get_result_properties(0)["has_initial_shape"]:
         labels.append("Initial")
         default_colours.append("blue")
-    if fitting_results[0].gt_shape is not None:
+    if get_result_properties(0)["has_gt_shape"]:
         labels.append("Groundtruth")
         default_colours.append("yellow")
     renderer_options_wid = RendererOptionsWidget(
@@ -2229,7 +2312,9 @@ def visualize_fitting_results(
     renderer_options_wid.options_widgets[1].line_colour_widget.set_colours(
         default_colours, allow_callback=False
     )
-    renderer_options_wid.add_render_function(render_function)
+    # Coalesce the render calls that are triggered while dragging the zoom
+    # and axes sliders
+    renderer_options_wid.add_render_function(debounce(render_function))
 
     # Create info and error options
     info_wid = TextPrintWidget(text_per_line=[""])
@@ -2243,55 +2328,81 @@ def visualize_fitting_results(
     )
     error_box = ipywidgets.VBox([error_type_toggles, norm_type_toggles])
     error_box.layout.display = (
-        "flex" if fitting_results[0].gt_shape is not None else "none"
+        "flex" if get_result_properties(0)["has_gt_shape"] else "none"
     )
     error_type_toggles.observe(update_info, names="value", type="change")
     norm_type_toggles.observe(update_info, names="value", type="change")
     info_error_box = ipywidgets.HBox([info_wid, error_box])
 
-    # Create save figure widget
-    save_figure_wid = SaveMatplotlibFigureOptionsWidget()
+    # Create save figure widget. It gets built when the Export tab is first
+    # selected.
+    save_figure_wid = _DeferredSaveFigure()
+
+    def build_save_figure_wid():
+        nonlocal save_figure_wid
+        save_figure_wid = SaveMatplotlibFigureOptionsWidget(save_figure_wid.renderer)
+        return save_figure_wid
+
+    # The renderer labels only depend on the view and the shapes that a
+    # fitting result has, so they are computed once per such key
+    labels_cache = {}
+
+    def get_renderer_labels(key):
+        if key not in labels_cache:
+            view, has_initial_shape, has_gt_shape, n_shapes = key
+            if view == "result":
+                # We are at the Results tab
+                labels = ["Final"]
+                if has_initial_shape:
+                    labels.append("Initial")
+                if has_gt_shape:
+                    labels.append("Groundtruth")
+            elif view == "animation":
+                # We are at the Iterations tab and the mode is 'Animation'
+                labels = None
+            else:
+                # We are at the Iterations tab and the mode is 'Static'
+                n_digits = len(str(n_shapes))
+                labels = []
+                for j in range(n_shapes):
+                    if j == 0 and has_initial_shape:
+                        labels.append("Initial")
+                    elif j == n_shapes - 1:
+                        labels.append("Final")
+                    else:
+                        labels.append("iteration {:0{}d}".format(j, n_digits))
+            labels_cache[key] = labels
+        labels = labels_cache[key]
+        return None if labels is None else list(labels)
 
     def update_renderer_options(change):
         # Get selected fitting result object
         i = image_number_wid.selected_values if n_fitting_results > 1 else 0
+        properties = get_result_properties(i)
 
         # Get labels
         if fitting_result_wid.result_iterations_tab.selected_index == 0:
-            # We are at the Results tab
-            labels = ["Final"]
-            if fitting_results[i].initial_shape is not None:
-                labels.append("Initial")
-            if fitting_results[i].gt_shape is not None:
-                labels.append("Groundtruth")
+            key = (
+                "result",
+                properties["has_initial_shape"],
+                properties["has_gt_shape"],
+                0,
+            )
+        elif fitting_result_wid.iterations_mode.value == "animation":
+            key = ("animation", False, False, 0)
         else:
-            # We are at the Iterations tab
-            if fitting_result_wid.iterations_mode.value == "animation":
-                # The mode is 'Animation'
-                labels = None
-            else:
-                # The mode is 'Static'
-                n_digits = len(str(len(fitting_results[i].shapes)))
-                labels = []
-                for j in list(range(len(fitting_results[i].shapes))):
-                    if j == 0 and fitting_results[i].initial_shape is not None:
-                        labels.append("Initial")
-                    elif j == len(fitting_results[i].shapes) - 1:
-                        labels.append("Final")
-                    else:
-                        labels.append("iteration {:0{}d}".format(j, n_digits))
-        renderer_options_wid.set_widget_state(labels=labels, allow_callback=False)
+            key = (
+                "static",
+                properties["has_initial_shape"],
+                False,
+                properties["n_shapes"],
+            )
+        renderer_options_wid.set_widget_state(
+            labels=get_renderer_labels(key), allow_callback=False
+        )
 
-    n_shapes = None
-    if fitting_results[0].is_iterative:
-        n_shapes = len(fitting_results[0].shapes)
-    has_costs = fitting_results[0].is_iterative and fitting_results[0].costs is not None
     fitting_result_wid = IterativeResultOptionsWidget(
-        has_gt_shape=fitting_results[0].gt_shape is not None,
-        has_initial_shape=fitting_results[0].initial_shape is not None,
-        has_image=fitting_results[0].image is not None,
-        n_shapes=n_shapes,
-        has_costs=has_costs,
+        **get_result_properties(0),
         render_function=render_function,
         tab_update_function=update_renderer_options,
         displacements_function=plot_displacements_function,
@@ -2310,19 +2421,8 @@ def visualize_fitting_results(
             i = image_number_wid.selected_values
 
             # Update fitting result options
-            n_shapes = None
-            if fitting_results[i].is_iterative:
-                n_shapes = len(fitting_results[i].shapes)
-            has_costs = (
-                fitting_results[i].is_iterative and fitting_results[i].costs is not None
-            )
             fitting_result_wid.set_widget_state(
-                has_gt_shape=fitting_results[i].gt_shape is not None,
-                has_initial_shape=fitting_results[i].initial_shape is not None,
-                has_image=fitting_results[i].image is not None,
-                n_shapes=n_shapes,
-                has_costs=has_costs,
-                allow_callback=False,
+                **get_result_properties(i), allow_callback=False
             )
 
             # Update renderer options
@@ -2331,8 +2431,11 @@ def visualize_fitting_results(
             # Render callback
             render_function({})
 
-        # Image selection slider
+        # Image selection slider. Dragging the slider only renders the most
+        # recent of the values that arrive in a burst.
         index = {"min": 0, "max": n_fitting_results - 1, "step": 1, "index": 0}
+        if browser_style == "slider":
+            update_widgets = debounce(update_widgets)
         image_number_wid = AnimationOptionsWidget(
             index,
             render_function=update_widgets,
@@ -2354,8 +2457,13 @@ def visualize_fitting_results(
         header_wid.layout.margin = "0px 10px 0px 0px"
     # Widget titles
     tab_titles = ["Result", "Info", "Renderer", "Export"]
-    options_box = ipywidgets.Tab(
-        [fitting_result_wid, info_error_box, renderer_options_wid, save_figure_wid]
+    options_box = lazy_tab(
+        [
+            fitting_result_wid,
+            info_error_box,
+            renderer_options_wid,
+            build_save_figure_wid,
+        ]
     )
     for k, tl in enumerate(tab_titles):
         options_box.set_title(k, tl)
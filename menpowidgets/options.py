@@ -1,3 +1,8 @@
+import asyncio
+from os import getcwd
+from os.path import join, splitext
+from pathlib import Path
+
 import ipywidgets
 from IPython.display import display, Javascript
 from traitlets.traitlets import Int, Dict, List
@@ -33,10 +38,9 @@ from .tools import (
 )
 from .style import map_styles_to_hex_colours
 from .utils import (
-    do_one_iteration,
     sample_colours_from_colourmap,
     lists_are_the_same,
-    sync_asyncio_sleep,
+    run_in_background,
 )
 
 
@@ -151,13 +155,6 @@ class AnimationOptionsWidget(MenpoWidget):
         continuous_update=False,
         style="",
     ):
-        from time import sleep
-        from IPython import get_ipython
-
-        # Get the kernel to use it later in order to make sure that the widgets'
-        # traits changes are passed during a while-loop
-        self.kernel = get_ipython().kernel
-
         # Create index widget
         if index_style == "slider":
             self.index_wid = IndexSliderWidget(
@@ -240,6 +237,7 @@ class AnimationOptionsWidget(MenpoWidget):
         self.interval_step = interval_step
         self.please_stop = False
         self.please_pause = False
+        self._animation_task = None
 
         # Set style
         self.predefined_style(style)
@@ -250,11 +248,11 @@ class AnimationOptionsWidget(MenpoWidget):
         )
 
         def loop_pressed(change):
+            self.loop_enabled = change["new"]
             if change["new"]:
                 self.loop_toggle.icon = "repeat"
             else:
                 self.loop_toggle.icon = "long-arrow-right"
-            do_one_iteration(self.kernel)
 
         self.loop_toggle.observe(loop_pressed, names="value", type="change")
 
@@ -264,17 +262,32 @@ class AnimationOptionsWidget(MenpoWidget):
             if tmp < 0:
                 tmp = 0
             self.interval = tmp
-            do_one_iteration(self.kernel)
 
         self.fast_forward_button.on_click(fast_forward_pressed)
 
         def fast_backward_pressed(name):
             self.interval += self.interval_step
-            do_one_iteration(self.kernel)
 
         self.fast_backward_button.on_click(fast_backward_pressed)
 
-        def animate(change):
+        # The index style is fixed, so pick the index setter once rather than
+        # on every animation frame
+        if index_style == "slider":
+
+            def set_index(i):
+                self.index_wid.slider.value = i
+
+        else:
+
+            def set_index(i):
+                self.index_wid.set_widget_state(
+                    {"min": self.min, "max": self.max, "step": self.step, "index": i},
+                    loop_enabled=self.loop_enabled,
+                    text_editable=False,
+                    allow_callback=True,
+                )
+
+        async def animate():
             # Get current index value
             i = self.selected_values
             # Disable the index widget
@@ -289,55 +302,32 @@ class AnimationOptionsWidget(MenpoWidget):
                     break
 
                 # Update index value
-                if index_style == "slider":
-                    self.index_wid.slider.value = i
-                else:
-                    self.index_wid.set_widget_state(
-                        {
-                            "min": self.min,
-                            "max": self.max,
-                            "step": self.step,
-                            "index": i,
-                        },
-                        loop_enabled=self.loop_enabled,
-                        text_editable=False,
-                        allow_callback=True,
-                    )
+                set_index(i)
 
                 # Update counter
-                if self.loop_toggle.value and i >= self.max:
+                if self.loop_enabled and i >= self.max:
                     i = self.min
                 else:
                     i += self.step
 
-                # Wait
-                sync_asyncio_sleep(self.interval)
-                # Run IPython iteration.
-                # This is the code that makes this operation non-blocking.
-                # This allows widget messages and callbacks to be processed.
-                do_one_iteration(self.kernel)
+                # Wait. While waiting, the kernel processes the widget
+                # messages and callbacks, e.g. the pause and stop buttons.
+                await asyncio.sleep(self.interval)
 
             # If stop was pressed, then reset
             if self.please_stop:
-                if index_style == "slider":
-                    self.index_wid.slider.value = 0
-                else:
-                    self.index_wid.set_widget_state(
-                        {
-                            "min": self.min,
-                            "max": self.max,
-                            "step": self.step,
-                            "index": 0,
-                        },
-                        loop_enabled=self.loop_enabled,
-                        text_editable=False,
-                        allow_callback=True,
-                    )
+                set_index(0)
 
             # Enable the index widget
             self.index_wid_disability(False)
 
-        self.play_button.on_click(animate)
+        def play_pressed(_):
+            # Ignore the button if the animation is already running
+            if self._animation_task is not None and not self._animation_task.done():
+                return
+            self._animation_task = run_in_background(animate())
+
+        self.play_button.on_click(play_pressed)
 
         def pause_pressed(_):
             self.pause_animation()
@@ -414,18 +404,20 @@ class AnimationOptionsWidget(MenpoWidget):
             * ``index`` : (`int`) The index value (e.g. ``10``).
 
         allow_callback : `bool`, optional
-            If ``True``, it allows triggering of any callback functions.
+            If ``True``, it allows triggering of any callback functions. The
+            render function is not called if the state is unchanged.
         """
         # Keep old value
         old_value = self.selected_values
 
         # Check if update is required
-        if (
+        changed = (
             index["index"] != self.selected_values
             or index["min"] != self.min
             or index["max"] != self.max
             or index["step"] != self.step
-        ):
+        )
+        if changed:
             # temporarily remove render callback
             render_function = self._render_function
             self.remove_render_function()
@@ -437,7 +429,7 @@ class AnimationOptionsWidget(MenpoWidget):
             else:
                 self.index_wid.set_widget_state(
                     index,
-                    loop_enabled=self.loop_toggle.value,
+                    loop_enabled=self.loop_enabled,
                     text_editable=True,
                     allow_callback=False,
                 )
@@ -449,8 +441,8 @@ class AnimationOptionsWidget(MenpoWidget):
             # re-assign render callback
             self.add_render_function(render_function)
 
-        # trigger render function if allowed
-        if allow_callback:
+        # trigger render function if allowed and the state actually changed
+        if allow_callback and changed:
             self.call_render_function(old_value, self.selected_values)
 
     def stop_animation(self):
@@ -2680,7 +2672,7 @@ class ImageOptionsWidget(MenpoWidget):
         if channels is None:
             return "0, 1, 2"
         elif isinstance(channels, list):
-            return str(channels).strip("[]")
+            return ", ".join(map(str, channels))
         else:
             return str(channels)
 
@@ -3307,13 +3299,18 @@ class TextPrintWidget(ipywidgets.Box):
 
     def set_widget_state(self, text_per_line):
         r"""
-        Method that updates the state of the widget with a new `list` of lines.
+        Method that updates the state of the widget with a new `list` of lines,
+        if it is different than `self.text_per_line`.
 
         Parameters
         ----------
         text_per_line : `list` of `str`
             The text to be printed per line.
         """
+        # Check if update is required, in order to avoid sending the same
+        # text to the front-end
+        if lists_are_the_same(text_per_line, self.text_per_line):
+            return
         txt = self._convert_text_list_to_html(text_per_line)
         self.text_html.value = txt
         self.text_per_line = text_per_line
@@ -3381,10 +3378,6 @@ class SaveMatplotlibFigureOptionsWidget(ipywidgets.Box):
         overwrite=False,
         style="",
     ):
-        from os import getcwd
-        from os.path import join, splitext
-        from pathlib import Path
-
         # Create widgets
         self.file_format_title = ipywidgets.HTML(value="Format")
         file_format_dict = OrderedDict()
@@ -3670,10 +3663,6 @@ class SaveMayaviFigureOptionsWidget(ipywidgets.Box):
         overwrite=False,
         style="",
     ):
-        from os import getcwd
-        from os.path import join
-        from pathlib import Path
-
         # Create widgets
         self.size_checkbox = SwitchWidget(
             size is not None,
@@ -4995,13 +4984,6 @@ class LinearModelParametersWidget(MenpoWidget):
         style="",
         continuous_update=False,
     ):
-        from time import sleep
-        from IPython import get_ipython
-
-        # Get the kernel to use it later in order to make sure that the widgets'
-        # traits changes are passed during a while-loop
-        self.kernel = get_ipython().kernel
-
         # If only one slider requested, then set mode to multiple
         if n_parameters == 1:
             mode = "multiple"
@@ -5125,6 +5107,7 @@ class LinearModelParametersWidget(MenpoWidget):
         self.animation_step = animation_step
         self.animation_visible = animation_visible
         self.please_stop = False
+        self._animation_task = None
 
         # Set style
         self.predefined_style(style)
@@ -5152,6 +5135,7 @@ class LinearModelParametersWidget(MenpoWidget):
             self.dropdown_params.observe(set_slider_value, names="value", type="change")
         else:
             # Assign saving values and main plotting function to all sliders
+            self._sliders_indices = {w: p for p, w in enumerate(self.sliders)}
             for w in self.sliders:
                 w.observe(self._save_slider_value_from_id, names="value", type="change")
 
@@ -5184,7 +5168,6 @@ class LinearModelParametersWidget(MenpoWidget):
                 self.loop_toggle.icon = "repeat"
             else:
                 self.loop_toggle.icon = "long-arrow-right"
-            do_one_iteration(self.kernel)
 
         self.loop_toggle.observe(loop_pressed, names="value", type="change")
 
@@ -5194,17 +5177,18 @@ class LinearModelParametersWidget(MenpoWidget):
             if tmp < 0:
                 tmp = 0
             self.interval = tmp
-            do_one_iteration(self.kernel)
 
         self.fast_forward_button.on_click(fast_forward_pressed)
 
         def fast_backward_pressed(name):
             self.interval += self.interval_step
-            do_one_iteration(self.kernel)
 
         self.fast_backward_button.on_click(fast_backward_pressed)
 
-        def animate(change):
+        # The animation runs as a task on the kernel's event loop, so the widget
+        # messages and callbacks, e.g. the stop button, get processed every time
+        # it waits
+        async def animate():
             reset_parameters("")
             self.please_stop = False
             self.reset_button.disabled = True
@@ -5216,9 +5200,6 @@ class LinearModelParametersWidget(MenpoWidget):
                     # animate from 0 to min
                     slider_val = 0.0
                     while slider_val > self.params_bounds[0]:
-                        # Run IPython iteration.
-                        do_one_iteration(self.kernel)
-
                         # Check stop flag
                         if self.please_stop:
                             break
@@ -5230,17 +5211,11 @@ class LinearModelParametersWidget(MenpoWidget):
                         self.sliders[slider_id].value = slider_val
 
                         # wait
-                        sync_asyncio_sleep(self.interval)
-
-                        # Run IPython iteration.
-                        do_one_iteration(self.kernel)
+                        await asyncio.sleep(self.interval)
 
                     # animate from min to max
                     slider_val = self.params_bounds[0]
                     while slider_val < self.params_bounds[1]:
-                        # Run IPython iteration.
-                        do_one_iteration(self.kernel)
-
                         # Check stop flag
                         if self.please_stop:
                             break
@@ -5252,17 +5227,11 @@ class LinearModelParametersWidget(MenpoWidget):
                         self.sliders[slider_id].value = slider_val
 
                         # wait
-                        sync_asyncio_sleep(self.interval)
-
-                        # Run IPython iteration.
-                        do_one_iteration(self.kernel)
+                        await asyncio.sleep(self.interval)
 
                     # animate from max to 0
                     slider_val = self.params_bounds[1]
                     while slider_val > 0.0:
-                        # Run IPython iteration.
-                        do_one_iteration(self.kernel)
-
                         # Check stop flag
                         if self.please_stop:
                             break
@@ -5274,10 +5243,7 @@ class LinearModelParametersWidget(MenpoWidget):
                         self.sliders[slider_id].value = slider_val
 
                         # wait
-                        sync_asyncio_sleep(self.interval)
-
-                        # Run IPython iteration.
-                        do_one_iteration(self.kernel)
+                        await asyncio.sleep(self.interval)
 
                     # reset value
                     self.sliders[slider_id].value = 0.0
@@ -5305,9 +5271,6 @@ class LinearModelParametersWidget(MenpoWidget):
                     # animate from 0 to min
                     slider_val = 0.0
                     while slider_val > self.params_bounds[0]:
-                        # Run IPython iteration.
-                        do_one_iteration(self.kernel)
-
                         # Check stop flag
                         if self.please_stop:
                             break
@@ -5319,17 +5282,11 @@ class LinearModelParametersWidget(MenpoWidget):
                         self.parameters_wid.children[1].value = slider_val
 
                         # wait
-                        sync_asyncio_sleep(self.interval)
-
-                        # Run IPython iteration.
-                        do_one_iteration(self.kernel)
+                        await asyncio.sleep(self.interval)
 
                     # animate from min to max
                     slider_val = self.params_bounds[0]
                     while slider_val < self.params_bounds[1]:
-                        # Run IPython iteration.
-                        do_one_iteration(self.kernel)
-
                         # Check stop flag
                         if self.please_stop:
                             break
@@ -5341,17 +5298,11 @@ class LinearModelParametersWidget(MenpoWidget):
                         self.parameters_wid.children[1].value = slider_val
 
                         # wait
-                        sync_asyncio_sleep(self.interval)
-
-                        # Run IPython iteration.
-                        do_one_iteration(self.kernel)
+                        await asyncio.sleep(self.interval)
 
                     # animate from max to 0
                     slider_val = self.params_bounds[1]
                     while slider_val > 0.0:
-                        # Run IPython iteration.
-                        do_one_iteration(self.kernel)
-
                         # Check stop flag
                         if self.please_stop:
                             break
@@ -5363,10 +5314,7 @@ class LinearModelParametersWidget(MenpoWidget):
                         self.parameters_wid.children[1].value = slider_val
 
                         # wait
-                        sync_asyncio_sleep(self.interval)
-
-                        # Run IPython iteration.
-                        do_one_iteration(self.kernel)
+                        await asyncio.sleep(self.interval)
 
                     # reset value
                     self.parameters_wid.children[1].value = 0.0
@@ -5383,7 +5331,13 @@ class LinearModelParametersWidget(MenpoWidget):
             self.reset_button.disabled = False
             self.plot_button.disabled = False
 
-        self.play_button.on_click(animate)
+        def play_pressed(_):
+            # Ignore the button if the animation is already running
+            if self._animation_task is not None and not self._animation_task.done():
+                return
+            self._animation_task = run_in_background(animate())
+
+        self.play_button.on_click(play_pressed)
 
         def stop_pressed(_):
             self.stop_animation()
@@ -5396,7 +5350,7 @@ class LinearModelParametersWidget(MenpoWidget):
 
     def _save_slider_value_from_id(self, change):
         current_parameters = list(self.selected_values)
-        i = self.sliders.index(change["owner"])
+        i = self._sliders_indices[change["owner"]]
         current_parameters[i] = change["new"]
         self.selected_values = current_parameters
 
@@ -5577,6 +5531,7 @@ class LinearModelParametersWidget(MenpoWidget):
                 self.parameters_wid.children = self.parameters_children
 
                 # Assign saving values and main plotting function to all sliders
+                self._sliders_indices = {w: p for p, w in enumerate(self.sliders)}
                 for w in self.sliders:
                     w.observe(
                         self._save_slider_value_from_id, names="value", type="change"
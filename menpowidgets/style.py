@@ -1,5 +1,21 @@
 from io import BytesIO
 
+# The hex colours of the predefined styles
+_HEX_COLOURS = {
+    "info": "#31708f",
+    "danger": "#A52A2A",
+    "success": "#228B22",
+    "warning": "#8A6D3B",
+    "primary": "#337ab7",
+}
+_BACKGROUND_HEX_COLOURS = {
+    "info": "#D9EDF7",
+    "danger": "#F2DEDE",
+    "success": "#DFF0D8",
+    "warning": "#FCF8E3",
+    "primary": "#337ab7",
+}
+
 
 def map_styles_to_hex_colours(style, background=False):
     r"""
@@ -23,31 +39,9 @@ def map_styles_to_hex_colours(style, background=False):
         The corresponding hex colour.
     """
     if background:
-        if style == "info":
-            return "#D9EDF7"
-        elif style == "danger":
-            return "#F2DEDE"
-        elif style == "success":
-            return "#DFF0D8"
-        elif style == "warning":
-            return "#FCF8E3"
-        elif style == "primary":
-            return "#337ab7"
-        else:
-            return None
+        return _BACKGROUND_HEX_COLOURS.get(style)
     else:
-        if style == "info":
-            return "#31708f"
-        elif style == "danger":
-            return "#A52A2A"
-        elif style == "success":
-            return "#228B22"
-        elif style == "warning":
-            return "#8A6D3B"
-        elif style == "primary":
-            return "#337ab7"
-        else:
-            return None
+        return _HEX_COLOURS.get(style)
 
 
 def parse_font_awesome_icon(option):
@@ -0,0 +1,135 @@
+import asyncio
+
+import ipywidgets
+import numpy as np
+from numpy.testing import assert_allclose
+
+from menpo.model import PCAModel, PCAVectorModel
+from menpo.shape import PointCloud
+
+from menpowidgets import utils
+from menpowidgets.utils import (
+    debounce,
+    lazy_tab,
+    pca_instance_vector,
+    scaled_pca_basis,
+)
+
+
+def _pca_model():
+    rng = np.random.RandomState(0)
+    samples = [PointCloud(rng.randn(20, 2)) for _ in range(10)]
+    return PCAModel(samples)
+
+
+def test_pca_instance_vector_matches_pca_model_instance():
+    model = _pca_model()
+    basis = scaled_pca_basis(model)
+    weights = [1.5, -0.5, 2.0]
+    instance = model.instance(weights, normalized_weights=True)
+    assert_allclose(
+        pca_instance_vector(weights, basis.components, basis.mean_vector),
+        instance.as_vector(),
+    )
+
+
+def test_pca_instance_vector_into_buffer():
+    model = _pca_model()
+    basis = scaled_pca_basis(model)
+    weights = np.array([0.3, 0.7])
+    out = np.empty_like(basis.mean_vector)
+    result = pca_instance_vector(weights, basis.components, basis.mean_vector, out=out)
+    assert result is out
+    assert_allclose(out, model.instance(weights, normalized_weights=True).as_vector())
+
+
+def test_pca_instance_vector_no_weights_is_mean():
+    model = _pca_model()
+    basis = scaled_pca_basis(model)
+    assert_allclose(
+        pca_instance_vector([], basis.components, basis.mean_vector),
+        model.mean().as_vector(),
+    )
+
+
+def test_pca_instance_vector_single_precision():
+    rng = np.random.RandomState(1)
+    model = PCAVectorModel(rng.randn(10, 50))
+    basis = scaled_pca_basis(model, dtype=np.float32)
+    weights = [1.0, -2.0]
+    result = pca_instance_vector(weights, basis.components, basis.mean_vector)
+    assert result.dtype == np.float32
+    assert_allclose(
+        result, model.instance(weights, normalized_weights=True), rtol=1e-4, atol=1e-5
+    )
+
+
+def test_scaled_pca_basis_is_cached_per_model():
+    model = _pca_model()
+    assert scaled_pca_basis(model) is scaled_pca_basis(model)
+    assert scaled_pca_basis(model, dtype=np.float32) is not scaled_pca_basis(model)
+
+
+def test_debounce_without_event_loop_calls_directly():
+    calls = []
+    debounced = debounce(calls.append, wait=10)
+    for k in range(3):
+        debounced(k)
+    assert calls == [0, 1, 2]
+
+
+def test_debounce_coalesces_calls_within_wait():
+    calls = []
+    debounced = debounce(calls.append, wait=0.05)
+
+    async def burst():
+        for k in range(5):
+            debounced(k)
+        # Only the first call is executed immediately
+        assert calls == [0]
+        await asyncio.sleep(0.1)
+
+    asyncio.run(burst())
+    assert calls == [0, 4]
+
+
+def test_debounce_shows_traceback_of_scheduled_call(monkeypatch):
+    class FakeShell(object):
+        n_tracebacks = 0
+
+        def showtraceback(self):
+            self.n_tracebacks += 1
+
+    shell = FakeShell()
+    monkeypatch.setattr(utils, "get_ipython", lambda: shell)
+
+    def fail(value):
+        if value > 0:
+            raise ValueError(value)
+
+    debounced = debounce(fail, wait=0.05)
+
+    async def burst():
+        debounced(0)
+        debounced(1)
+        await asyncio.sleep(0.1)
+
+    asyncio.run(burst())
+    assert shell.n_tracebacks == 1
+
+
+def test_lazy_tab_builds_child_on_first_selection():
+    built = []
+
+    def build():
+        built.append(ipywidgets.Label("built"))
+        return built[-1]
+
+    tab = lazy_tab([ipywidgets.Label("model"), build])
+    assert built == []
+    assert isinstance(tab.children[1], ipywidgets.Box)
+    tab.selected_index = 1
+    assert tab.children[1] is built[0]
+    tab.selected_index = 0
+    tab.selected_index = 1
+    assert len(built) == 1
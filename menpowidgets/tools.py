@@ -20,12 +20,18 @@ from .utils import (
     parse_float_range_command,
 )
 
-# Global variables to try and reduce overhead of loading the logo
-MENPO_MINIMAL_LOGO = None
-MENPO_DANGER_LOGO = None
-MENPO_WARNING_LOGO = None
-MENPO_SUCCESS_LOGO = None
-MENPO_INFO_LOGO = None
+# The file names of the logo images per style
+_LOGO_FILENAMES = {
+    "": "menpoproject_minimal.png",
+    "danger": "menpoproject_danger.png",
+    "info": "menpoproject_info.png",
+    "warning": "menpoproject_warning.png",
+    "success": "menpoproject_success.png",
+}
+
+# The PNG bytes of the logo images per style. Each logo is loaded and encoded
+# the first time it is needed.
+_LOGO_BYTES = {}
 
 
 class LogoWidget(ipywidgets.Box):
@@ -40,75 +46,21 @@ class LogoWidget(ipywidgets.Box):
     """
 
     def __init__(self, style=""):
-        from menpowidgets.base import menpowidgets_src_dir_path
-        import menpo.io as mio
-
-        # Try to only load the logo once
-        global MENPO_LOGO_SCALE
-        logos_path = menpowidgets_src_dir_path() / "logos"
-        width = 50
-        height = 66.5
-        if style == "":
-            global MENPO_MINIMAL_LOGO
-            if MENPO_MINIMAL_LOGO is None:
-                MENPO_MINIMAL_LOGO = mio.import_image(
-                    logos_path / "menpoproject_minimal.png"
-                )
-            self.image = ipywidgets.Image(
-                value=convert_image_to_bytes(MENPO_MINIMAL_LOGO),
-                width=width,
-                height=height,
-            )
-        elif style == "danger":
-            global MENPO_DANGER_LOGO
-            if MENPO_DANGER_LOGO is None:
-                MENPO_DANGER_LOGO = mio.import_image(
-                    logos_path / "menpoproject_{}.png".format(style)
-                )
-            self.image = ipywidgets.Image(
-                value=convert_image_to_bytes(MENPO_DANGER_LOGO),
-                width=width,
-                height=height,
-            )
-        elif style == "info":
-            global MENPO_INFO_LOGO
-            if MENPO_INFO_LOGO is None:
-                MENPO_INFO_LOGO = mio.import_image(
-                    logos_path / "menpoproject_{}.png".format(style)
-                )
-            self.image = ipywidgets.Image(
-                value=convert_image_to_bytes(MENPO_INFO_LOGO),
-                width=width,
-                height=height,
-            )
-        elif style == "warning":
-            global MENPO_WARNING_LOGO
-            if MENPO_WARNING_LOGO is None:
-                MENPO_WARNING_LOGO = mio.import_image(
-                    logos_path / "menpoproject_{}.png".format(style)
-                )
-            self.image = ipywidgets.Image(
-                value=convert_image_to_bytes(MENPO_WARNING_LOGO),
-                width=width,
-                height=height,
-            )
-        elif style == "success":
-            global MENPO_SUCCESS_LOGO
-            if MENPO_SUCCESS_LOGO is None:
-                MENPO_SUCCESS_LOGO = mio.import_image(
-                    logos_path / "menpoproject_{}.png".format(style)
-                )
-            self.image = ipywidgets.Image(
-                value=convert_image_to_bytes(MENPO_SUCCESS_LOGO),
-                width=width,
-                height=height,
-            )
-        else:
+        if style not in _LOGO_FILENAMES:
             raise ValueError(
                 "style must be 'minimal', 'info', 'danger', "
                 "'warning', 'success' or ''; {} was "
                 "given.".format(style)
             )
+        if style not in _LOGO_BYTES:
+            from menpowidgets.base import menpowidgets_src_dir_path
+            import menpo.io as mio
+
+            logo = mio.import_image(
+                menpowidgets_src_dir_path() / "logos" / _LOGO_FILENAMES[style]
+            )
+            _LOGO_BYTES[style] = convert_image_to_bytes(logo)
+        self.image = ipywidgets.Image(value=_LOGO_BYTES[style], width=50, height=66.5)
         super(LogoWidget, self).__init__(children=[self.image])
 
 
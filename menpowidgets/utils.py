@@ -1,9 +1,17 @@
 import asyncio
+from functools import lru_cache, wraps
+from io import BytesIO
 from struct import pack as struct_pack
+from time import monotonic
 import binascii
+import weakref
 
+import ipywidgets
+from IPython import get_ipython
 import nest_asyncio
 import numpy as np
+from menpo.visualize import view_patches
+from scipy.linalg.blas import get_blas_funcs
 
 
 def do_one_iteration(kernel):
@@ -24,6 +32,102 @@ def sync_asyncio_sleep(interval):
     loop.run_until_complete(task)
 
 
+def run_in_background(coroutine):
+    r"""
+    Function that schedules the provided `coroutine` as a task on the running
+    event loop, i.e. the event loop of the IPython kernel. Thus, the coroutine
+    runs without blocking the kernel and the widgets' messages and callbacks
+    get processed every time it awaits. If there is no running event loop, e.g.
+    when the widgets are driven from a plain Python script, the coroutine is
+    run with ``asyncio.run``, so the call blocks until the coroutine completes.
+
+    Parameters
+    ----------
+    coroutine : `coroutine`
+        The coroutine to be run.
+
+    Returns
+    -------
+    task : `asyncio.Task` or ``None``
+        The scheduled task. It is ``None`` if the coroutine was run until it
+        completed.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(coroutine)
+        return None
+    return loop.create_task(coroutine)
+
+
+def debounce(function, wait=0.05):
+    r"""
+    Function that returns a debounced version of the provided `function`. It is
+    mainly used to wrap the render functions of the widgets, so that a fast
+    slider drag does not queue a render for every intermediate value.
+
+    A call that arrives at least `wait` seconds after the previously executed
+    one is executed immediately. Otherwise, it is scheduled on the running
+    event loop to be executed once the `wait` interval has elapsed, replacing
+    any call that is already pending. Thus, only the most recent call of a
+    burst gets executed and the rendering rate is capped to ``1 / wait``. If
+    there is no running event loop, `function` is always called directly.
+
+    A scheduled call does not run within the message handler of a widget, so
+    its errors are shown with IPython's traceback, as ipywidgets does for the
+    errors of the widgets' callbacks.
+
+    Parameters
+    ----------
+    function : `callable`
+        The function to be debounced.
+    wait : `float`, optional
+        The minimum interval (in seconds) between two executions of `function`.
+
+    Returns
+    -------
+    debounced_function : `callable`
+        The debounced function. It has the same signature as `function`.
+    """
+    state = {"handle": None, "last_call": None}
+
+    @wraps(function)
+    def debounced_function(*args, **kwargs):
+        def call():
+            state["handle"] = None
+            state["last_call"] = monotonic()
+            function(*args, **kwargs)
+
+        def scheduled_call():
+            try:
+                call()
+            except Exception:
+                ip = get_ipython()
+                if ip is None:
+                    raise
+                ip.showtraceback()
+
+        # Cancel any pending call, since this one supersedes it
+        if state["handle"] is not None:
+            state["handle"].cancel()
+            state["handle"] = None
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or state["last_call"] is None:
+            call()
+            return
+        elapsed = monotonic() - state["last_call"]
+        if elapsed >= wait:
+            call()
+        else:
+            state["handle"] = loop.call_later(wait - elapsed, scheduled_call)
+
+    return debounced_function
+
+
 def lists_are_the_same(a, b):
     r"""
     Function that checks if two `lists` have the same elements in the same
@@ -690,7 +794,10 @@ def list_has_constant_step(l):
         return False, 1
 
 
-def sample_colours_from_colourmap(n_colours, colour_map):
+@lru_cache(maxsize=32)
+def _sample_colours_from_colourmap(n_colours, colour_map):
+    # The sampled colours only depend on the arguments, so they are memoised as
+    # an immutable tuple
     import matplotlib.pyplot as plt
 
     cm = plt.get_cmap(colour_map)
@@ -698,7 +805,305 @@ def sample_colours_from_colourmap(n_colours, colour_map):
     for i in range(n_colours):
         c = cm(1.0 * i / n_colours)[:3]
         colours.append(decode_colour([int(i * 255) for i in c]))
-    return colours
+    return tuple(colours)
+
+
+def sample_colours_from_colourmap(n_colours, colour_map):
+    return list(_sample_colours_from_colourmap(n_colours, colour_map))
+
+
+class ScaledPCABasis(object):
+    r"""
+    Holder of the components of a PCA model scaled by the square root of their
+    eigenvalues, along with the model's mean vector. It is returned by
+    :func:`scaled_pca_basis`.
+
+    Parameters
+    ----------
+    pca_model : `menpo.model.PCAModel` or `menpo.model.PCAVectorModel`
+        The PCA model. Only a weak reference to it is kept.
+    components : ``(n_active_components, n_features)`` `ndarray`
+        The active components, each one multiplied by the square root of its
+        eigenvalue.
+    mean_vector : ``(n_features,)`` `ndarray`
+        The mean of the model as a vector.
+    """
+
+    def __init__(self, pca_model, components, mean_vector):
+        self._pca_model = weakref.ref(pca_model)
+        self.components = components
+        self.mean_vector = mean_vector
+
+    def is_basis_of(self, pca_model):
+        r"""
+        Method that checks whether the basis was computed from the provided
+        model with its current number of active components.
+
+        Parameters
+        ----------
+        pca_model : `menpo.model.PCAModel` or `menpo.model.PCAVectorModel`
+            The PCA model.
+
+        Returns
+        -------
+        is_basis_of : `bool`
+            ``True`` if the basis corresponds to `pca_model`.
+        """
+        return (
+            self._pca_model() is pca_model
+            and self.components.shape[0] == pca_model.n_active_components
+        )
+
+
+# The scaled bases that are currently in use, so that repeated invocations of a
+# widget with the same model share the basis instead of computing a new one.
+# Each basis is dropped as soon as no widget holds it.
+_scaled_pca_bases = weakref.WeakValueDictionary()
+
+
+def scaled_pca_basis(pca_model, dtype=np.float64):
+    r"""
+    Function that returns the components of a PCA model scaled by the square
+    root of their eigenvalues, along with the model's mean vector. With these,
+    an instance that corresponds to weights expressed in std units can be
+    reconstructed with a single matrix-vector product, see
+    :func:`pca_instance_vector`.
+
+    The basis is shared among all the callers that hold it, thus the returned
+    object must be kept alive for as long as it is used.
+
+    Parameters
+    ----------
+    pca_model : `menpo.model.PCAModel` or `menpo.model.PCAVectorModel`
+        The PCA model.
+    dtype : `numpy.dtype`, optional
+        The data type of the returned arrays. Using ``np.float32`` halves the
+        memory traffic of the reconstruction, which is adequate when the
+        instances are only used for visualization.
+
+    Returns
+    -------
+    basis : `ScaledPCABasis`
+        The object with the scaled ``components`` and the ``mean_vector``.
+    """
+    key = (id(pca_model), np.dtype(dtype).str)
+    basis = _scaled_pca_bases.get(key)
+    if basis is not None and basis.is_basis_of(pca_model):
+        return basis
+
+    components = pca_model.components * np.sqrt(pca_model.eigenvalues)[:, None]
+    mean_vector = pca_model.mean()
+    if not isinstance(mean_vector, np.ndarray):
+        mean_vector = mean_vector.as_vector()
+    # The components must be C-contiguous, so that each one is a unit-stride
+    # row of the matrix-vector product
+    basis = ScaledPCABasis(
+        pca_model,
+        np.ascontiguousarray(components, dtype=dtype),
+        mean_vector.astype(dtype, copy=False),
+    )
+    _scaled_pca_bases[key] = basis
+    return basis
+
+
+def scaled_pca_bases(pca_models, dtype=np.float64):
+    r"""
+    Function that returns the :func:`scaled_pca_basis` of each one of the
+    provided PCA models, e.g. of the levels of a multi-scale model.
+
+    Parameters
+    ----------
+    pca_models : `list` of `menpo.model.PCAModel` or `menpo.model.PCAVectorModel`
+        The PCA models.
+    dtype : `numpy.dtype`, optional
+        The data type of the returned arrays.
+
+    Returns
+    -------
+    bases : `list` of `ScaledPCABasis`
+        The scaled basis of each model.
+    """
+    return [scaled_pca_basis(m, dtype=dtype) for m in pca_models]
+
+
+def pca_instance_vector(weights, components, mean_vector, out=None):
+    r"""
+    Function that reconstructs the vector of a PCA model instance given the
+    arrays of the basis returned by :func:`scaled_pca_basis`.
+
+    Parameters
+    ----------
+    weights : `list` or ``(n_weights,)`` `ndarray`
+        The weights, in std units, of the first ``n_weights`` components.
+    components : ``(n_active_components, n_features)`` `ndarray`
+        The scaled components.
+    mean_vector : ``(n_features,)`` `ndarray`
+        The mean vector.
+    out : ``(n_features,)`` `ndarray` or ``None``, optional
+        A C-contiguous buffer with the same data type as `components` to store
+        the result in. If ``None``, then a new array is allocated.
+
+    Returns
+    -------
+    instance_vector : ``(n_features,)`` `ndarray`
+        The reconstructed vector. It has the same data type as `components`.
+
+    Notes
+    -----
+    The reconstruction is performed by a single BLAS ``gemv`` call on the
+    transposed components, which are Fortran-contiguous and thus passed to
+    BLAS without a copy.
+    """
+    # Cast the weights, so that the product does not upcast the components
+    weights = np.asarray(weights, dtype=components.dtype)
+    if out is None:
+        out = mean_vector.copy()
+    else:
+        out[:] = mean_vector
+    if len(weights) == 0:
+        return out
+    gemv = get_blas_funcs("gemv", (components,))
+    return gemv(
+        1.0, components[: len(weights)].T, weights, beta=1.0, y=out, overwrite_y=True
+    )
+
+
+def update_mayavi_mesh(renderer, points, colours=None):
+    r"""
+    Function that updates in place the vertices and (optionally) the per-vertex
+    colours of the mesh that is rendered by a Mayavi renderer. This avoids
+    tearing down and rebuilding the whole VTK pipeline when only the geometry
+    of the mesh changes, e.g. when visualizing the instances of a model.
+
+    Parameters
+    ----------
+    renderer : `menpo3d.visualize.MayaviViewer` or subclass
+        The renderer object that was used to render the mesh.
+    points : ``(n_points, 3)`` `ndarray`
+        The new vertices of the mesh.
+    colours : ``(n_points, 3)`` `ndarray` or ``None``, optional
+        The new per-vertex colours of the mesh, in the ``[0, 1]`` range. If
+        ``None``, then the colours are not updated.
+
+    Returns
+    -------
+    updated : `bool`
+        ``True`` if the mesh got updated. ``False`` if the figure does not
+        contain a single mesh with the same number of vertices, in which case
+        nothing is changed and the mesh needs to be rendered from scratch.
+    """
+    figure = getattr(renderer, "figure", None)
+    if figure is None:
+        return False
+    actors = figure.scene.renderer.actors
+    if len(actors) != 1:
+        return False
+    poly_data = actors[0].mapper.input
+    if poly_data is None or poly_data.number_of_points != points.shape[0]:
+        return False
+    poly_data.points = points
+    if colours is not None:
+        poly_data.point_data.scalars = (colours * 255.0).astype(np.uint8)
+    poly_data.modified()
+    return True
+
+
+def mayavi_figure_is_visible(renderer):
+    r"""
+    Function that checks whether the window of a Mayavi renderer's figure is
+    currently shown on screen. A hidden or minimized window does not need to be
+    drawn, since VTK redraws the scene anyway once it gets exposed again.
+
+    Parameters
+    ----------
+    renderer : `menpo3d.visualize.MayaviViewer` or subclass
+        The renderer object.
+
+    Returns
+    -------
+    is_visible : `bool`
+        ``False`` if the figure's window is known to be hidden or minimized.
+        ``True`` otherwise, including when the GUI toolkit does not allow to
+        check it.
+    """
+    figure = getattr(renderer, "figure", None)
+    control = getattr(getattr(figure, "scene", None), "control", None)
+    if control is None or not hasattr(control, "isVisible"):
+        return True
+    return control.isVisible() and not control.window().isMinimized()
+
+
+def render_pca_variance_to_png(pca_model):
+    r"""
+    Function that plots the eigenvalues ratio and the cumulative eigenvalues
+    ratio of a PCA model side by side and returns the figure as PNG bytes.
+    The plots of a model never change, so the returned bytes can be cached
+    and displayed again with ``IPython.display.Image``.
+
+    Parameters
+    ----------
+    pca_model : `menpo.model.PCAModel` or `menpo.model.PCAVectorModel`
+        The PCA model.
+
+    Returns
+    -------
+    png : `bytes`
+        The PNG-encoded figure.
+    """
+    import matplotlib.pyplot as plt
+
+    figure = plt.figure()
+    plt.subplot(121)
+    pca_model.plot_eigenvalues_ratio()
+    plt.subplot(122)
+    pca_model.plot_eigenvalues_cumulative_ratio()
+    fp = BytesIO()
+    figure.savefig(fp, format="png", bbox_inches="tight")
+    plt.close(figure)
+    return fp.getvalue()
+
+
+def lazy_tab(children):
+    r"""
+    Function that creates an `ipywidgets.Tab` some of whose children are only
+    built when their tab gets selected for the first time. Until then, an empty
+    placeholder box is shown in their place. This avoids the construction of
+    option widgets that the user might never open.
+
+    Parameters
+    ----------
+    children : `list` of `ipywidgets.Widget` or `callable`
+        The children of the tab. A `callable` child is called without any
+        arguments on the first selection of its tab and must return the actual
+        child widget.
+
+    Returns
+    -------
+    tab : `ipywidgets.Tab`
+        The tab widget.
+    """
+    builders = {}
+    placeholders = []
+    for k, child in enumerate(children):
+        if isinstance(child, ipywidgets.Widget):
+            placeholders.append(child)
+        else:
+            builders[k] = child
+            placeholders.append(ipywidgets.Box())
+    tab = ipywidgets.Tab(placeholders)
+
+    def build_selected_child(change):
+        k = change["new"]
+        if k in builders:
+            tab_children = list(tab.children)
+            tab_children[k] = builders.pop(k)()
+            tab.children = tab_children
+            if not builders:
+                tab.unobserve(build_selected_child, names="selected_index")
+
+    if builders:
+        tab.observe(build_selected_child, names="selected_index", type="change")
+    return tab
 
 
 def extract_group_labels_from_landmarks(landmark_manager):
@@ -928,9 +1333,6 @@ def render_patches(
     axes_y_ticks,
     figure_size,
 ):
-    from menpo.transform import UniformScale
-    from menpo.visualize import view_patches
-
     renderer = view_patches(
         patches,
         patch_centers,